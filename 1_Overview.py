@@ -1,48 +1,10 @@
+import os
 import streamlit as st
 from streamlit.components.v1 import html
 import pandas as pd
-from utils.generate_maps import render_ireland_map
-from utils.common import ROI, NI
-from typing import Tuple
-
-#constants / data
-USD_RATES_2023 = {
-    "GBPUSD": 1.2440,
-    "EURUSD": 1.0817,
-}
-
-NATIONS = {
-    "ROI": {
-        "name": "Republic of Ireland (ROI)",
-        "overview": "An independent, sovereign nation",
-        "capital": "Dublin",
-        "gdp_usd_b": 551.604,
-        "gdp_native_b": 509.952,
-        "native_currency": "EUR (€)",
-        "counties": 26,
-        "map_colour": "Green",
-    },
-    "NI": {
-        "name": "Northern Ireland (NI)",
-        "overview": "A constituent nation of the United Kingdom (UK)",
-        "capital": "Belfast",
-        "gdp_usd_b": 78.701,
-        "gdp_native_b": 63.265,
-        "native_currency": "GBP (£)",
-        "counties": 6,
-        "map_colour": "Blue",
-    },
-    "ALL": {
-        "name": "All-Island",
-        "overview": "A geographical island comprising ROI and NI",
-        "capital": "Dublin / Belfast",
-        "gdp_usd_b": 630.305,
-        "gdp_native_b": None,  #mixed currencies
-        "native_currency": "EUR + GBP (€ + £)",
-        "counties": 32,
-        "map_colour": "Green + Blue",
-    },
-}
+from utils.generate_maps import load_geojson, merge_island_geojson, render_ireland_map_from_dicts
+from utils.common import NATIONS, ROI, NI
+from typing import Optional, Tuple
 
 # State
 
@@ -54,47 +16,43 @@ def _toggle_view() -> None:
 def _load_latest_census_populations() -> dict:
     #uses the cleaned demographics file
     path = "data/cleaned/demographics/population_over_time.csv"
-    df = pd.read_csv(path)
-
-    required = {"Year", "Region", "Population"}
-    if not required.issubset(df.columns):
-        raise ValueError(f"Expected columns {sorted(required)}, got {list(df.columns)}")
-
-    df["Year"] = pd.to_numeric(df["Year"], errors="coerce")
-    df["Population"] = pd.to_numeric(df["Population"], errors="coerce")
-    df["Region"] = df["Region"].astype(str).str.strip()
-    df = df.dropna(subset=["Year", "Population"])
+    #arrow reader with explicit dtypes skips type inference (raises if a column is missing)
+    df = pd.read_csv(
+        path,
+        engine="pyarrow",
+        usecols=["Year", "Region", "Population"],
+        dtype={"Year": "int32", "Population": "int64", "Region": "string[pyarrow]"},
+    )
+    df["Region"] = df["Region"].str.strip()
 
     region_map = {
         ROI: "ROI",
         NI: "NI",
     }
 
+    #latest census row per region in one O(n) pass
+    latest = df.loc[df.groupby("Region")["Year"].idxmax()].set_index("Region")
+
     out: dict = {}
     for region_name, key in region_map.items():
-        sub = df[df["Region"] == region_name].sort_values("Year")
-        if sub.empty:
+        if region_name not in latest.index:
             continue
-        latest = sub.iloc[-1]
-        year = int(latest["Year"])
-        pop = int(latest["Population"])
+        year = int(latest.at[region_name, "Year"])
+        pop = int(latest.at[region_name, "Population"])
         out[key] = (f"{pop:,}", f"Census {year}")
 
     # Calculate All-Island total if both ROI and NI exist
     if "ROI" in out and "NI" in out:
-        roi_pop = int(out["ROI"][0].replace(",", ""))
-        ni_pop = int(out["NI"][0].replace(",", ""))
-        all_pop = roi_pop + ni_pop
+        all_pop = int(latest.loc[[ROI, NI], "Population"].sum())
         # Use the most recent year from either region
-        roi_df = df[df["Region"] == ROI].sort_values("Year")
-        ni_df = df[df["Region"] == NI].sort_values("Year")
-        latest_year = max(int(roi_df.iloc[-1]["Year"]), int(ni_df.iloc[-1]["Year"]))
+        latest_year = int(latest.loc[[ROI, NI], "Year"].max())
         out["ALL"] = (f"{all_pop:,}", f"Census {latest_year}")
 
     return out
 
 
-@st.cache_data(show_spinner=False)
+#static for the life of the process; cache_resource hands back the same frame (no pickle/copy per rerun)
+@st.cache_resource(show_spinner=False)
 def build_intro_table() -> pd.DataFrame:
     pop_map = _load_latest_census_populations()
     return pd.DataFrame(
@@ -135,18 +93,48 @@ def build_intro_table() -> pd.DataFrame:
     )
 
 
-@st.cache_data(show_spinner=False)
-def render_map_html(view: str) -> str:
-    if view == "county":
-        ireland_path = "data/raw/geojson/ie_county.json"
-        ni_path = "data/raw/geojson/ni_county.geojson"
-        county_view = True
-    else:
-        ireland_path = "data/raw/geojson/ie.json"
-        ni_path = "data/raw/geojson/northern_ireland.geojson"
-        county_view = False
+#view -> (merged static file, raw ROI file, raw NI file)
+MAP_FILES = {
+    "nation": ("island_simplified.geojson", "ie.json", "northern_ireland.geojson"),
+    "county": ("island_county_simplified.geojson", "ie_county.json", "ni_county.geojson"),
+}
+#one rendered map per view is kept in each session
+MAP_HTML_CACHE_SIZE = len(MAP_FILES)
+
 
-    return render_ireland_map(ireland_path, ni_path, county_view)
+def _map_paths(view: str) -> Tuple[str, ...]:
+    #prefer the merged, pre-simplified island file (cleaning_scripts/clean_map_geodata.py);
+    #the raw ROI + NI pair is a dev fallback
+    static_name, ireland_raw, ni_raw = MAP_FILES[view]
+    static_path = f"static/geojson/{static_name}"
+    if os.path.exists(static_path):
+        return (static_path,)
+    return (f"data/raw/geojson/{ireland_raw}", f"data/raw/geojson/{ni_raw}")
+
+
+def _static_url(path: str) -> Optional[str]:
+    #files under static/ are served by streamlit at app/static/, so the browser fetches and caches them
+    if path.startswith("static/"):
+        return f"app/{path}"
+    return None
+
+
+#mtimes are part of the cache key only: a replaced GeoJSON invalidates the cached HTML
+@st.cache_data(show_spinner=False)
+def render_map_html(view: str, mtimes: Tuple[float, ...]) -> str:
+    paths = _map_paths(view)
+
+    #parsed GeoJSON is shared across sessions via cache_resource; only the HTML is cached per view
+    if len(paths) == 1:
+        return render_ireland_map_from_dicts(
+            load_geojson(paths[0]),
+            view == "county",
+            url=_static_url(paths[0]),
+        )
+    return render_ireland_map_from_dicts(
+        merge_island_geojson(load_geojson(paths[0]), load_geojson(paths[1])),
+        view == "county",
+    )
 
 
 def render_header() -> None:
@@ -177,8 +165,7 @@ def render_overview_controls() -> Tuple[str, str]:
     disable_native: bool = (focus == "All-Island")
 
     #set/repair session state BEFORE creating the radio widget
-    if "gdp_mode_radio" not in st.session_state:
-        st.session_state["gdp_mode_radio"] = "USD (comparable)"
+    st.session_state.setdefault("gdp_mode_radio", "USD (comparable)")
 
     if disable_native and st.session_state["gdp_mode_radio"] == "Native currency":
         st.session_state["gdp_mode_radio"] = "USD (comparable)"
@@ -228,17 +215,24 @@ def render_kpis(focus: str, gdp_mode: str) -> None:
     k4.metric("Currency", data["native_currency"])
 
 
+#fragment: the view toggle only reruns the map panel, not the whole page
+@st.fragment
 def render_map_panel():
-    #persistent view
-    if "view" not in st.session_state:
-        st.session_state.view = "nation"
-
     left, right = st.columns([3, 1], gap="large")
 
     with left:
         st.subheader("Map")
-        map_html = render_map_html(st.session_state.view)
-        html(map_html, height=420)
+        view = st.session_state.view
+        key = (view, tuple(os.path.getmtime(path) for path in _map_paths(view)))
+
+        #session-local copy: fragment reruns skip cache_data's hashing + unpickling,
+        #while cache_data still serves a session's first render of each view
+        map_cache = st.session_state.setdefault("_map_html_cache", {})
+        if key not in map_cache:
+            if len(map_cache) >= MAP_HTML_CACHE_SIZE:
+                map_cache.pop(next(iter(map_cache)))
+            map_cache[key] = render_map_html(*key)
+        html(map_cache[key], height=420)
 
     with right:
         st.write(f"**Current view:** {st.session_state.view.title()}")
@@ -258,7 +252,6 @@ def render_map_panel():
         st.caption("Markers indicate capital cities")
 
 
-
 def main() -> None:
     st.set_page_config(
         page_title="ROI + NI Dashboard",
@@ -267,6 +260,9 @@ def main() -> None:
         initial_sidebar_state="expanded",
     )
 
+    #persistent state (toggled via the map panel's on_click callback)
+    st.session_state.setdefault("view", "nation")
+
     render_header()
 
     st.subheader("Overview")
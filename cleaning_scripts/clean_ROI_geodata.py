@@ -1,17 +1,51 @@
 import geopandas as gpd
+import numpy as np
+import orjson
+import shapely
+from pyproj import Transformer
+
+#simplification tolerance in degrees (~50m), keeps shared county borders intact
+SIMPLIFY_TOLERANCE = 0.0005
+#5 d.p. is ~1m precision, plenty for a national-scale map
+COORDINATE_PRECISION = 5
+#output CRS expected by folium
+WGS84 = 4326
 
 #loads ITM (EPSG:2157) geojson
 gdf = gpd.read_file("data/raw/geojson/ie.json")
-#forces crs if missing
+#forces crs if missing (geojson is read as WGS84 already, overriding it would
+#shrink the island to a point that simplification then erases)
+if gdf.crs is None:
+    gdf = gdf.set_crs(epsg=2157)
+#converts to WGS84 - right format
+#every vertex goes through one vectorised pyproj call instead of per-geometry dispatch;
+#skipped entirely when the file is already WGS84 (the transform would be an identity)
+if gdf.crs.equals(WGS84):
+    gdf_4326 = gdf
+else:
+    transformer = Transformer.from_crs(gdf.crs, WGS84, always_xy=True)
+    gdf_4326 = gdf.set_geometry(
+        shapely.transform(
+            gdf.geometry.values,
+            lambda coords: np.column_stack(transformer.transform(coords[:, 0], coords[:, 1])),
+        ),
+        crs=WGS84,
+    )
 
+#simplifies polygons so the browser has far fewer vertices to parse/draw
+gdf_4326["geometry"] = gdf_4326.geometry.simplify(SIMPLIFY_TOLERANCE, preserve_topology=True)
 
-gdf = gdf.set_crs(epsg=2157, allow_override=True) 
-#converts to WGS84 - right format
-gdf_4326 = gdf.to_crs(epsg=4326)
+#truncated coordinates keep the file small
+gdf_4326["geometry"] = shapely.transform(
+    gdf_4326.geometry.values, lambda coords: coords.round(COORDINATE_PRECISION)
+)
 
-#saves output
-gdf_4326.to_file("data/cleaned/geojson/cleaned_ROI.geojson", driver="GeoJSON")
+#saves output - orjson encodes the coordinate arrays far faster than the GDAL writer
+with open("data/cleaned/geojson/cleaned_ROI.geojson", "wb") as file:
+    file.write(orjson.dumps(
+        gdf_4326.to_geo_dict(drop_id=True),
+        option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_APPEND_NEWLINE,
+    ))
 
 #NOTE this script only has to be run once
 print("Converted -> cleaned_ROI.geojson")
-
@@ -10,12 +10,10 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 import pandas as pd
 
 from utils.cleaning import (
-    ensure_cols,
     latest_timestamped_file,
-    parse_census_year,
-    map_regions,
-    clean_string_column,
-    clean_numeric_column,
+    skip_if_current,
+    load_cpni,
+    write_cleaned_table,
 )
 
 #constants
@@ -24,6 +22,7 @@ CLEAN_DIR = Path("data/cleaned/economy")
 
 TABLE_PREFIX = "CPNI48"
 OUT_PATH = CLEAN_DIR / "commute_mode.csv"
+PARQUET_PATH = OUT_PATH.with_suffix(".parquet")
 
 REQUIRED_COLS: List[str] = [
     "Statistic Label",
@@ -34,51 +33,44 @@ REQUIRED_COLS: List[str] = [
     "VALUE",
 ]
 
-DROP_MODES = {"All means of travel"}
-
-
-def clean_commute_mode(raw_path: Path) -> pd.DataFrame:
-    df = pd.read_csv(raw_path)
-    ensure_cols(df, REQUIRED_COLS)
+STRING_COLS: List[str] = [
+    "Statistic Label",
+    "Census Year",
+    "Ireland and Northern Ireland",
+    "Means of Travel",
+    "UNIT",
+]
 
-    df["Statistic Label"] = clean_string_column(df["Statistic Label"])
-    df["Census Year"] = clean_string_column(df["Census Year"])
-    df["Ireland and Northern Ireland"] = clean_string_column(df["Ireland and Northern Ireland"])
-    df["Means of Travel"] = clean_string_column(df["Means of Travel"])
-    df["UNIT"] = clean_string_column(df["UNIT"])
+DROP_MODES = {"All means of travel"}
 
-    df["VALUE"] = clean_numeric_column(df["VALUE"])
-    df = df.dropna(subset=["VALUE"]).copy()
+#lower-cased UNIT -> output column
+UNIT_COLUMNS = {"%": "Share", "number": "Persons"}
 
-    df = map_regions(df, "Ireland and Northern Ireland", "Region")
 
-    df["Year"] = df["Census Year"].apply(parse_census_year).astype(int)
+def clean_commute_mode(raw_path: Path) -> pd.DataFrame:
+    df = load_cpni(raw_path, REQUIRED_COLS, STRING_COLS)
     df = df.rename(columns={"Means of Travel": "Mode"})
 
     if DROP_MODES:
-        df = df[~df["Mode"].isin(DROP_MODES)].copy()
-
-    pct = df[df["UNIT"].eq("%")].copy()
-    num = df[df["UNIT"].str.lower().eq("number")].copy()
-
-    pct = pct.rename(columns={"VALUE": "Share"})
-    num = num.rename(columns={"VALUE": "Persons"})
-
-    out = pct[["Year", "Region", "Mode", "Share"]].merge(
-        num[["Year", "Region", "Mode", "Persons"]],
-        on=["Year", "Region", "Mode"],
-        how="outer",
+        df = df[~df["Mode"].isin(DROP_MODES)]
+
+    #one pivot (mean dedupes repeats) instead of split -> outer merge -> groupby
+    #low-cardinality keys as categoricals: the pivot groups on integer codes
+    df["UNIT"] = df["UNIT"].str.lower().map(UNIT_COLUMNS)
+    df = df.astype({"Region": "category", "Mode": "category"})
+    out = (
+        df.dropna(subset=["UNIT"])
+        .pivot_table(
+            index=["Year", "Region", "Mode"], columns="UNIT", values="VALUE", aggfunc="mean", observed=True
+        )
+        .reindex(columns=list(UNIT_COLUMNS.values()))
+        .reset_index()
+        .rename_axis(None, axis=1)
     )
 
     if out["Share"].isna().all() and out["Persons"].isna().all():
         raise ValueError("No usable rows found after splitting by UNIT ('%' and 'Number').")
 
-    out["Share"] = pd.to_numeric(out["Share"], errors="coerce")
-    out["Persons"] = pd.to_numeric(out["Persons"], errors="coerce")
-
-    out = out.groupby(["Year", "Region", "Mode"], as_index=False).agg(
-        {"Share": "mean", "Persons": "mean"}
-    )
     out = out.sort_values(["Year", "Region", "Mode"]).reset_index(drop=True)
 
     return out
@@ -88,10 +80,14 @@ def main() -> None:
     CLEAN_DIR.mkdir(parents=True, exist_ok=True)
 
     raw_path = latest_timestamped_file(RAW_DIR, TABLE_PREFIX)
+
+    if skip_if_current(PARQUET_PATH, raw_path, Path(__file__)):
+        return
+
     cleaned = clean_commute_mode(raw_path)
 
-    cleaned.to_csv(OUT_PATH, index=False)
-    print(f"Wrote {len(cleaned)} rows to {OUT_PATH}")
+    write_cleaned_table(cleaned, OUT_PATH)
+    print(f"Wrote {len(cleaned)} rows to {OUT_PATH} (+ {PARQUET_PATH.name})")
 
 
 if __name__ == "__main__":
@@ -12,11 +12,8 @@ import pandas as pd
 from utils.cleaning import (
     get_project_root,
     find_raw_file,
-    parse_census_year,
-    map_regions,
-    clean_string_column,
-    clean_numeric_column,
-    STANDARD_REGION_MAP,
+    load_cpni,
+    write_cleaned_table,
 )
 
 #constants
@@ -32,61 +29,47 @@ FILTER_STATISTIC_CONTAINS: Final[str | None] = "cross border commuters for work"
 FILTER_SEX: Final[str] = "Both sexes"
 FILTER_UNIT: Final[str] = "Number"
 
+REQUIRED_COLS: Final[List[str]] = [
+    "Statistic Label",
+    "Census Year",
+    "Ireland and Northern Ireland",
+    "Sex",
+    "Age Group",
+    "UNIT",
+    "VALUE",
+]
+
+STRING_COLS: Final[List[str]] = [
+    "Statistic Label",
+    "Census Year",
+    "Ireland and Northern Ireland",
+    "Sex",
+    "Age Group",
+    "UNIT",
+]
+
 
 def clean_cross_border_commuters(raw_path: Path) -> pd.DataFrame:
-    df: pd.DataFrame = pd.read_csv(raw_path)
-
-    required_cols = {
-        "Statistic Label",
-        "Census Year",
-        "Ireland and Northern Ireland",
-        "Sex",
-        "Age Group",
-        "UNIT",
-        "VALUE",
-    }
-    missing = required_cols - set(df.columns)
-    if missing:
-        raise ValueError(
-            f"Missing required columns: {sorted(missing)}\n"
-            f"Columns found: {list(df.columns)}"
-        )
-
-    out = df.copy()
-
-    out["Statistic Label"] = clean_string_column(out["Statistic Label"])
-    out["Census Year"] = clean_string_column(out["Census Year"])
-    out["Ireland and Northern Ireland"] = clean_string_column(out["Ireland and Northern Ireland"])
-    out["Sex"] = clean_string_column(out["Sex"])
-    out["Age Group"] = clean_string_column(out["Age Group"])
-    out["UNIT"] = clean_string_column(out["UNIT"])
-
-    if FILTER_STATISTIC_CONTAINS is not None:
-        out = out[out["Statistic Label"].str.contains(FILTER_STATISTIC_CONTAINS, case=False, na=False)]
-        if out.empty:
-            raise ValueError(
-                "After filtering by statistic label, no rows remain. "
-                "Check FILTER_STATISTIC_CONTAINS against the raw file."
-            )
-
-    out = out[out["Sex"].eq(FILTER_SEX)].copy()
-
-    out = out[out["UNIT"].eq(FILTER_UNIT)].copy()
+    #per-row commuter counts: float32 is exact at this scale and halves the column
+    out = load_cpni(
+        raw_path, REQUIRED_COLS, STRING_COLS,
+        statistic_contains=FILTER_STATISTIC_CONTAINS, value_dtype="float32",
+    )
+
+    #one combined mask; filtered frames are already new objects, no .copy() needed
+    out = out[out["Sex"].eq(FILTER_SEX) & out["UNIT"].eq(FILTER_UNIT)]
     if out.empty:
         raise ValueError("No rows remain after filtering to absolute numbers (UNIT='Number').")
 
-    out["VALUE"] = clean_numeric_column(out["VALUE"])
-    out = out.dropna(subset=["VALUE"]).copy()
-
-    out = map_regions(out, "Ireland and Northern Ireland", "Region")
-
-    out["Year"] = out["Census Year"].apply(parse_census_year).astype(int)
     out = out.rename(columns={"Age Group": "Age group", "VALUE": "Persons"})
 
-    out = out[["Year", "Region", "Age group", "Persons"]].copy()
-    out["Persons"] = pd.to_numeric(out["Persons"], errors="coerce").astype(int)
+    out = out[["Year", "Region", "Age group", "Persons"]]
+    #VALUE is already numeric (clean_numeric_column + dropna); one cast, no re-parse
+    out["Persons"] = out["Persons"].astype("int32")
 
-    out = out.groupby(["Year", "Region", "Age group"], as_index=False)["Persons"].sum()
+    #low-cardinality keys as categoricals: the groupby hashes integer codes, not strings
+    out = out.astype({"Region": "category", "Age group": "category"})
+    out = out.groupby(["Year", "Region", "Age group"], as_index=False, observed=True)["Persons"].sum()
     out = out.sort_values(["Year", "Region", "Age group"]).reset_index(drop=True)
 
     return out
@@ -104,7 +87,7 @@ def main() -> None:
     cleaned = clean_cross_border_commuters(raw_path)
 
     out_path = clean_dir / CLEAN_FILENAME
-    cleaned.to_csv(out_path, index=False)
+    write_cleaned_table(cleaned, out_path)
 
     print(f"Read raw:     {raw_path}")
     print(f"Wrote cleaned:{out_path}")
@@ -1,21 +1,29 @@
 from __future__ import annotations
 
+import re
 import sys
 from pathlib import Path
-from typing import List
+from typing import Final
 
 # Add project root to path for utils import
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
+import numpy as np
 import pandas as pd
 
 from utils.cleaning import (
     get_project_root,
     find_raw_file,
+    read_cso_csv,
+    clean_string_columns,
+    load_population_weights,
+    weighted_group_mean,
+    write_cleaned_table,
     STANDARD_REGION_MAP,
     ROI_LABEL,
     NI_LABEL,
     ALL_LABEL,
+    REGION_DTYPE,
 )
 
 #constants (edit if needed)
@@ -38,56 +46,20 @@ FILTER_UNIT: Final[str | None] = None
 PREFER_BOTH_SEXES: Final[bool] = True
 
 
+#digits before an optional "/second year" part
+_FIRST_YEAR_RE: Final[re.Pattern[str]] = re.compile(r"^(\d+)\s*(?:/.*)?$")
+
+
 #year normalisation
-def normalise_census_year(y: object) -> int | None:
+def normalise_census_years(years: pd.Series) -> pd.Series:
     """
-    Normalise census year formats.
+    Normalise census year formats in one vectorised str.extract pass.
     - "1936/1937" -> 1936 (uses FIRST year for historical data)
     - "1946" -> 1946
+    Anything else becomes <NA>.
     """
-    s = str(y).strip()
-    if "/" in s:
-        left = s.split("/")[0].strip()
-        return int(left) if left.isdigit() else None
-    return int(s) if s.isdigit() else None
-
-
-#load population weights
-def load_population_over_time(clean_dir: Path) -> pd.DataFrame:
-    path = clean_dir / POP_TIME_CLEAN_FILENAME
-    if not path.exists():
-        raise FileNotFoundError(
-            f"Missing {POP_TIME_CLEAN_FILENAME}; required for All-Island weighting."
-        )
-
-    pop = pd.read_csv(path)
-    required = {"Year", "Region", "Population"}
-    if not required.issubset(pop.columns):
-        raise ValueError(
-            f"{POP_TIME_CLEAN_FILENAME} must contain columns: Year, Region, Population"
-        )
-
-    pop = pop.copy()
-    pop["Year"] = pd.to_numeric(pop["Year"], errors="coerce").astype("Int64")
-    pop["Population"] = pd.to_numeric(pop["Population"], errors="coerce").astype("Int64")
-    pop["Region"] = pop["Region"].astype(str).str.strip()
-
-    pop = pop.dropna(subset=["Year", "Population"]).copy()
-    pop["Year"] = pop["Year"].astype(int)
-    pop["Population"] = pop["Population"].astype(int)
-
-    pop = pop[pop["Region"].isin([ROI_LABEL, NI_LABEL])].copy()
-
-    if pop.duplicated(subset=["Year", "Region"]).any():
-        pop = pop.groupby(["Year", "Region"], as_index=False)["Population"].sum()
-
-    return pop
-
-
-#column identification
-def _col(df: pd.DataFrame, *names: str) -> str | None:
-    wanted = {n.strip().lower() for n in names}
-    return next((c for c in df.columns if c.strip().lower() in wanted), None)
+    first = years.astype(str).str.strip().str.extract(_FIRST_YEAR_RE, expand=False)
+    return pd.to_numeric(first, errors="coerce").astype("Int64")
 
 
 def _choose_stat_label(stat_series: pd.Series) -> str:
@@ -125,28 +97,28 @@ def _choose_stat_label(stat_series: pd.Series) -> str:
 
 #cleaner
 def clean_dependency_ratio_over_time(raw_path: Path, pop_time: pd.DataFrame) -> pd.DataFrame:
-    df = pd.read_csv(raw_path)
-
-    col_stat = _col(df, "Statistic Label")
-    col_year = _col(df, "Year", "Census Year", "CensusYear", "Census_Year")
-    col_sex = _col(df, "Sex")
-    col_region = _col(df, "Ireland and Northern Ireland", "Region")
-    col_unit = _col(df, "UNIT", "Unit")
-    col_value = _col(df, "VALUE", "Value", "Values")
-
-    required = [col_stat, col_year, col_region, col_value]
-    if any(c is None for c in required):
-        raise ValueError(
-            "Could not identify required columns in CPNI04 export.\n"
-            f"Columns found: {list(df.columns)}\n"
-            "Need at least: Statistic Label, Year/Census Year, Ireland and Northern Ireland/Region, VALUE."
-        )
+    df, cols = read_cso_csv(
+        raw_path,
+        {
+            "stat": ("Statistic Label",),
+            "year": ("Year", "Census Year", "CensusYear", "Census_Year"),
+            "sex": ("Sex",),
+            "region": ("Ireland and Northern Ireland", "Region"),
+            "unit": ("UNIT", "Unit"),
+            "value": ("VALUE", "Value", "Values"),
+        },
+        required=["stat", "year", "region", "value"],
+        what="CPNI04 export",
+    )
+    col_stat, col_year, col_sex = cols["stat"], cols["year"], cols["sex"]
+    col_region, col_unit, col_value = cols["region"], cols["unit"], cols["value"]
 
-    out = df.copy()
+    #strip each label column once (arrow kernel); filters, region mapping and sex selection reuse it
+    clean_string_columns(df, [c for c in (col_stat, col_sex, col_region, col_unit) if c is not None])
 
     #choose statistic label robustly
-    stat_label = FILTER_STATISTIC_LABEL or _choose_stat_label(out[col_stat])
-    out = out[out[col_stat].astype(str).str.strip().eq(stat_label)].copy()
+    stat_label = FILTER_STATISTIC_LABEL or _choose_stat_label(df[col_stat])
+    out = df[df[col_stat].eq(stat_label)]
 
     if out.empty:
         raise ValueError(
@@ -155,7 +127,7 @@ def clean_dependency_ratio_over_time(raw_path: Path, pop_time: pd.DataFrame) ->
         )
 
     if FILTER_UNIT is not None and col_unit is not None:
-        out = out[out[col_unit].astype(str).str.strip().eq(FILTER_UNIT)].copy()
+        out = out[out[col_unit].eq(FILTER_UNIT)]
 
     rename_map: dict[str, str] = {
         col_year: "Year",
@@ -167,65 +139,44 @@ def clean_dependency_ratio_over_time(raw_path: Path, pop_time: pd.DataFrame) ->
 
     out = out.rename(columns=rename_map)
 
-    out["Region"] = (
-        out["Region"].astype(str).str.strip().map(STANDARD_REGION_MAP).fillna(out["Region"].astype(str).str.strip())
-    )
+    out["Region"] = out["Region"].map(STANDARD_REGION_MAP).fillna(out["Region"])
 
     #year normalisation (handles "1936/1937" -> 1936)
-    out["Year"] = out["Year"].map(normalise_census_year)
+    out["Year"] = normalise_census_years(out["Year"])
 
     out["Dependency ratio"] = pd.to_numeric(out["Dependency ratio"], errors="coerce")
 
-    out = out.dropna(subset=["Year", "Dependency ratio"]).copy()
+    out = out.dropna(subset=["Year", "Dependency ratio"])
     out["Year"] = out["Year"].astype(int)
 
-    out = out[out["Region"].isin([ROI_LABEL, NI_LABEL])].copy()
+    out = out[out["Region"].isin([ROI_LABEL, NI_LABEL])]
 
     #remove sex dimension (overall only)
     if "Sex" in out.columns:
-        out["Sex"] = out["Sex"].astype(str).str.strip()
+        both_sexes = out["Sex"].str.lower().eq("both sexes")
 
-        if PREFER_BOTH_SEXES and (out["Sex"].str.lower() == "both sexes").any():
-            out = out[out["Sex"].str.lower() == "both sexes"].copy()
+        if PREFER_BOTH_SEXES and both_sexes.any():
+            out = out[both_sexes]
             out = out.groupby(["Year", "Region"], as_index=False)["Dependency ratio"].mean()
         else:
             out = out.groupby(["Year", "Region"], as_index=False)["Dependency ratio"].mean()
     else:
-        if out.duplicated(subset=["Year", "Region"]).any():
-            out = out.groupby(["Year", "Region"], as_index=False)["Dependency ratio"].mean()
+        out = out.groupby(["Year", "Region"], as_index=False, sort=False)["Dependency ratio"].mean()
 
     #all-Island derivation (population-weighted)
-    weights = (
-        pop_time.pivot(index="Year", columns="Region", values="Population")
-        .rename(columns={ROI_LABEL: "ROI_pop", NI_LABEL: "NI_pop"})
-        .reset_index()
-    )
-    weights["Total_pop"] = weights["ROI_pop"] + weights["NI_pop"]
-
-    tmp = out.merge(weights, on="Year", how="left")
-
-    def _weighted_all_island(g: pd.DataFrame) -> float:
-        roi = g[g["Region"] == ROI_LABEL]
-        ni = g[g["Region"] == NI_LABEL]
-
-        if roi.empty or ni.empty:
-            return float(g["Dependency ratio"].mean())
-
-        total = g["Total_pop"].iloc[0]
-        if pd.isna(total) or total <= 0:
-            return float(g["Dependency ratio"].mean())
-
-        return float(
-            (roi["Dependency ratio"].iloc[0] * g["ROI_pop"].iloc[0]
-             + ni["Dependency ratio"].iloc[0] * g["NI_pop"].iloc[0])
-            / total
-        )
-
-    all_island = (
-        tmp.groupby("Year", as_index=False)
-        .apply(lambda g: pd.Series({"Dependency ratio": _weighted_all_island(g)}))
-        .reset_index(drop=True)
-    )
+    #one bincount pass over the (Year, Region) rows: weighted mean where every row of the
+    #year has a population and the total is positive, plain mean otherwise
+    #population looked up per row on the (Year, Region) index, no joined frame
+    populations = pop_time.set_index(["Year", "Region"])["Population"]
+    pop = populations.reindex(pd.MultiIndex.from_frame(out[["Year", "Region"]])).to_numpy(dtype="float64")
+    codes, years = pd.factorize(out["Year"], sort=True)
+    ratio = out["Dependency ratio"].to_numpy(dtype="float64")
+
+    weighted, total_pop = weighted_group_mean(codes, ratio, pop, len(years))
+    plain = np.bincount(codes, weights=ratio, minlength=len(years)) / np.bincount(codes, minlength=len(years))
+    usable = ~np.isnan(weighted) & (total_pop > 0)
+
+    all_island = pd.DataFrame({"Year": years, "Dependency ratio": np.where(usable, weighted, plain)})
     all_island["Region"] = ALL_LABEL
 
     out = pd.concat([out, all_island], ignore_index=True)
@@ -233,7 +184,9 @@ def clean_dependency_ratio_over_time(raw_path: Path, pop_time: pd.DataFrame) ->
     #final rounding
     out["Dependency ratio"] = out["Dependency ratio"].round(1)
 
-    out = out.sort_values(["Region", "Year"]).reset_index(drop=True)
+    #region as integer codes, in the same alphabetical order the string sort gave
+    out["Region"] = out["Region"].astype(REGION_DTYPE)
+    out = out.sort_values(["Region", "Year"], kind="stable").reset_index(drop=True)
 
     return out[["Year", "Region", "Dependency ratio"]]
 
@@ -246,12 +199,12 @@ def main() -> None:
     clean_dir.mkdir(parents=True, exist_ok=True)
 
     raw_path = find_raw_file(raw_dir, RAW_FILE_PREFIX, RAW_FORCE_FILENAME)
-    pop_time = load_population_over_time(clean_dir)
+    pop_time = load_population_weights(clean_dir / POP_TIME_CLEAN_FILENAME)
 
     cleaned = clean_dependency_ratio_over_time(raw_path, pop_time)
 
     out_path = clean_dir / CLEAN_FILENAME
-    cleaned.to_csv(out_path, index=False)
+    write_cleaned_table(cleaned, out_path)
 
     print(f"Project root: {project_root}")
     print(f"Read raw:      {raw_path}")
@@ -10,12 +10,16 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 import pandas as pd
 
 from utils.cleaning import (
-    ensure_cols,
+    read_raw_csv,
+    check_percentage_totals,
     latest_timestamped_file,
-    parse_census_year,
+    parse_census_years,
     map_regions,
     clean_string_column,
     clean_numeric_column,
+    pivot_units,
+    skip_if_current,
+    write_cleaned_table,
 )
 
 #constants
@@ -24,6 +28,7 @@ CLEAN_DIR = Path("data/cleaned/social_indicators")
 
 TABLE_PREFIX = "CPNI51"
 OUT_PATH = CLEAN_DIR / "education_qualifications.csv"
+PARQUET_PATH = OUT_PATH.with_suffix(".parquet")
 
 REQUIRED_COLS: List[str] = [
     "Statistic Label",
@@ -42,62 +47,30 @@ DROP_QUALIFICATIONS = {
 
 
 def clean_education_qualifications(raw_path: Path) -> pd.DataFrame:
-    df = pd.read_csv(raw_path)
-    ensure_cols(df, REQUIRED_COLS)
+    df = read_raw_csv(raw_path, REQUIRED_COLS)
 
     df["Statistic Label"] = clean_string_column(df["Statistic Label"])
-    df["Census Year"] = clean_string_column(df["Census Year"])
     df["Ireland and Northern Ireland"] = clean_string_column(df["Ireland and Northern Ireland"])
     df["Sex"] = clean_string_column(df["Sex"])
     df["Level of Education"] = clean_string_column(df["Level of Education"])
     df["UNIT"] = clean_string_column(df["UNIT"])
 
     df["VALUE"] = clean_numeric_column(df["VALUE"])
-    df = df.dropna(subset=["VALUE"]).copy()
+    df = df.dropna(subset=["VALUE"])
 
     df = map_regions(df, "Ireland and Northern Ireland", "Region")
 
-    df["Year"] = df["Census Year"].apply(parse_census_year).astype(int)
+    df["Year"] = parse_census_years(df["Census Year"])
     df = df.rename(columns={"Level of Education": "Qualification"})
 
     #drop totals
-    df = df[~df["Qualification"].isin(DROP_QUALIFICATIONS)].copy()
-
-    #validate units
-    unit_map = {"%": "Percentage", "Number": "Absolute"}
-    df["UNIT_M"] = df["UNIT"].map(unit_map)
-    if df["UNIT_M"].isna().any():
-        bad = sorted(df.loc[df["UNIT_M"].isna(), "UNIT"].unique())
-        raise ValueError(f"Unexpected UNIT values encountered: {bad}")
-
-    #pivot UNIT -> columns
-    out = (
-        df[["Year", "Region", "Sex", "Qualification", "UNIT_M", "VALUE"]]
-        .rename(columns={"UNIT_M": "unit", "VALUE": "value"})
-        .pivot_table(
-            index=["Year", "Region", "Sex", "Qualification"],
-            columns="unit",
-            values="value",
-            aggfunc="sum",
-        )
-        .reset_index()
-    )
-
-    if "Percentage" not in out.columns or "Absolute" not in out.columns:
-        raise ValueError(f"Expected both Percentage and Absolute after pivot; got: {list(out.columns)}")
-
-    out["Percentage"] = pd.to_numeric(out["Percentage"], errors="coerce")
-    out["Absolute"] = pd.to_numeric(out["Absolute"], errors="coerce")
-
-    if out[["Percentage", "Absolute"]].isna().any().any():
-        raise ValueError("Found NaNs in Percentage/Absolute after pivot + coercion")
-
-    out["Absolute"] = out["Absolute"].round(0).astype(int)
+    df = df[~df["Qualification"].isin(DROP_QUALIFICATIONS)]
+
+    #validate units and pivot UNIT -> columns: one groupby + unstack on the keys
+    out = pivot_units(df, ["Year", "Region", "Sex", "Qualification"])
 
     #sanity check: percentages should sum to ~100 per region/sex/year
-    check = out.groupby(["Region", "Sex", "Year"])["Percentage"].sum().round(1)
-    if not all(check.between(99.0, 101.0)):
-        raise ValueError(f"Education qualification percentages do not sum to ~100 by region/sex/year: {check.to_dict()}")
+    check_percentage_totals(out, ["Region", "Sex", "Year"], "Education qualification")
 
     out = out.sort_values(["Year", "Region", "Sex", "Qualification"]).reset_index(drop=True)
 
@@ -108,10 +81,14 @@ def main() -> None:
     CLEAN_DIR.mkdir(parents=True, exist_ok=True)
 
     raw_path = latest_timestamped_file(RAW_DIR, TABLE_PREFIX)
+
+    if skip_if_current(PARQUET_PATH, raw_path, Path(__file__)):
+        return
+
     cleaned = clean_education_qualifications(raw_path)
 
-    cleaned.to_csv(OUT_PATH, index=False)
-    print(f"Wrote {len(cleaned)} rows to {OUT_PATH}")
+    write_cleaned_table(cleaned, OUT_PATH)
+    print(f"Wrote {len(cleaned)} rows to {OUT_PATH} (+ {PARQUET_PATH.name})")
 
 
 if __name__ == "__main__":
@@ -1,15 +1,25 @@
+import sys
+
 import pandas as pd
 from pathlib import Path
 
+# Add project root to path for utils import
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from utils.cleaning import read_raw_csv, write_cleaned_table
+
 # File paths
 RAW_DATA = Path(__file__).parent.parent / "data" / "raw" / "cultural_identity" / "CPNI14.20260108T220137.csv"
 CLEANED_DATA = Path(__file__).parent.parent / "data" / "cleaned" / "cultural_identity" / "ethnicity.csv"
 
+# Only the columns used below are read
+USE_COLS = ["Census Year", "Ireland and Northern Ireland", "Ethnicity", "UNIT", "VALUE"]
+
 # Drop totals
 DROP_ETHNICITIES = {"All ethnic or cultural backgrounds"}
 
 def clean_ethnicity():
-    df = pd.read_csv(RAW_DATA)
+    df = read_raw_csv(RAW_DATA, USE_COLS)
     
     # Standardize region names
     df["Ireland and Northern Ireland"] = df["Ireland and Northern Ireland"].replace({
@@ -20,13 +30,13 @@ def clean_ethnicity():
     # Filter out total rows
     df = df[~df["Ethnicity"].isin(DROP_ETHNICITIES)]
     
+    # Low-cardinality keys as categoricals so the reshape works on integer codes
+    df = df.astype({"Ireland and Northern Ireland": "category", "Ethnicity": "category"})
+    
     # Pivot UNIT column to get Absolute and Percentage as separate columns
-    df_pivot = df.pivot_table(
-        index=["Census Year", "Ireland and Northern Ireland", "Ethnicity"],
-        columns="UNIT",
-        values="VALUE",
-        aggfunc="first"
-    ).reset_index()
+    # (a plain reshape that raises on a repeated key/unit rather than silently dropping it)
+    index_cols = ["Census Year", "Ireland and Northern Ireland", "Ethnicity"]
+    df_pivot = df.pivot(index=index_cols, columns="UNIT", values="VALUE").reset_index()
     
     # Rename columns
     df_pivot.columns.name = None
@@ -49,7 +59,7 @@ def clean_ethnicity():
     
     # Save cleaned data
     CLEANED_DATA.parent.mkdir(parents=True, exist_ok=True)
-    df_pivot.to_csv(CLEANED_DATA, index=False)
+    write_cleaned_table(df_pivot, CLEANED_DATA)
     
     print(f"✅ Cleaned data saved to {CLEANED_DATA}")
     print(f"Total rows: {len(df_pivot)}")
@@ -1,28 +1,57 @@
+import sys
+
 import pandas as pd
 from pathlib import Path
 
+# Add project root to path for utils import
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from utils.cleaning import skip_if_current, write_cleaned_table
+
 # File paths
 RAW_DATA = Path(__file__).parent.parent / "data" / "raw" / "social_indicators" / "CPNI25.20260108T010109.csv"
 CLEANED_DATA = Path(__file__).parent.parent / "data" / "cleaned" / "social_indicators" / "general_health_by_age.csv"
+CLEANED_PARQUET = CLEANED_DATA.with_suffix(".parquet")
+
+# Only the columns used below are read
+USE_COLS = ["Statistic Label", "Census Year", "Ireland and Northern Ireland", "General Health", "Age Group", "VALUE"]
+
+# Low-cardinality label columns are parsed as categoricals, so the renames below touch a handful of categories, not every row
+CATEGORY_COLS = ["Ireland and Northern Ireland", "General Health", "Age Group"]
+
+REGION_NAMES = {
+    "Ireland": "Republic of Ireland",
+    "Northern Ireland": "Northern Ireland"
+}
 
 # Drop ratings (totals we don't need)
 DROP_RATINGS = {"All"}
 DROP_AGES = {"All ages"}
 
 def clean_general_health_by_age():
-    df = pd.read_csv(RAW_DATA)
+    if skip_if_current(CLEANED_PARQUET, RAW_DATA, Path(__file__)):
+        return
+
+    df = pd.read_csv(
+        RAW_DATA,
+        engine="pyarrow",
+        usecols=USE_COLS,
+        dtype={col: "category" for col in CATEGORY_COLS},
+        dtype_backend="pyarrow",
+    )
     
     # Filter to only Percentage rows (not the Number rows)
     df = df[df["Statistic Label"].str.contains("Percentage")]
     
     # Standardize region names
-    df["Ireland and Northern Ireland"] = df["Ireland and Northern Ireland"].replace({
-        "Ireland": "Republic of Ireland",
-        "Northern Ireland": "Northern Ireland"
-    })
+    df["Ireland and Northern Ireland"] = df["Ireland and Northern Ireland"].cat.rename_categories(
+        lambda name: REGION_NAMES.get(name, name)
+    )
     
     # Clean rating names (remove "General health - " prefix)
-    df["General Health"] = df["General Health"].str.replace("General health - ", "")
+    df["General Health"] = df["General Health"].cat.rename_categories(
+        lambda name: name.replace("General health - ", "")
+    )
     
     # Filter out "All" rating (total) and "All ages" 
     df = df[~df["General Health"].isin(DROP_RATINGS)]
@@ -43,15 +72,20 @@ def clean_general_health_by_age():
         "VALUE": "Percentage"
     })
     
+    # Region keeps integer codes with its categories in alphabetical order; the other labels go back
+    # to plain strings so the sort below is alphabetical, not category order
+    df["Region"] = df["Region"].cat.reorder_categories(sorted(df["Region"].cat.categories))
+    df = df.astype({"Rating": "string[pyarrow]", "Age_Bracket": "string[pyarrow]"})
+    
     # Convert percentage to numeric
     df["Percentage"] = pd.to_numeric(df["Percentage"], errors="coerce")
     
     # Sort for consistency
-    df = df.sort_values(["Year", "Region", "Age_Bracket", "Rating"]).reset_index(drop=True)
+    df = df.sort_values(["Year", "Region", "Age_Bracket", "Rating"], kind="stable").reset_index(drop=True)
     
     # Save cleaned data
     CLEANED_DATA.parent.mkdir(parents=True, exist_ok=True)
-    df.to_csv(CLEANED_DATA, index=False)
+    write_cleaned_table(df, CLEANED_DATA)
     
     print(f"✅ Cleaned data saved to {CLEANED_DATA}")
     print(f"Total rows: {len(df)}")
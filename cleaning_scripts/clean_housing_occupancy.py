@@ -10,12 +10,16 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 import pandas as pd
 
 from utils.cleaning import (
-    ensure_cols,
+    read_raw_csv,
+    check_percentage_totals,
     latest_timestamped_file,
-    parse_census_year,
+    parse_census_years,
     map_regions,
-    clean_string_column,
+    pivot_units,
+    clean_string_columns,
     clean_numeric_column,
+    skip_if_current,
+    write_cleaned_table,
 )
 
 #constants
@@ -24,6 +28,7 @@ CLEAN_DIR = Path("data/cleaned/social_indicators")
 
 TABLE_PREFIX = "CPNI32"
 OUT_PATH = CLEAN_DIR / "housing_occupancy.csv"
+PARQUET_PATH = OUT_PATH.with_suffix(".parquet")
 
 TARGET_YEAR = 2022
 
@@ -35,6 +40,12 @@ REQUIRED_COLS: List[str] = [
     "VALUE",
 ]
 
+STRING_COLS: List[str] = [
+    "Ireland and Northern Ireland",
+    "Type of Housing Stock",
+    "UNIT",
+]
+
 #drop non-distribution rows
 DROP_LABELS = {"Total housing stock"}
 
@@ -52,69 +63,31 @@ def _normalise_occupancy(label: str) -> str:
 
 
 def clean_housing_occupancy(raw_path: Path) -> pd.DataFrame:
-    df = pd.read_csv(raw_path)
-    ensure_cols(df, REQUIRED_COLS)
+    df = read_raw_csv(raw_path, REQUIRED_COLS)
 
-    df["Census Year"] = clean_string_column(df["Census Year"])
-    df["Ireland and Northern Ireland"] = clean_string_column(df["Ireland and Northern Ireland"])
-    df["Type of Housing Stock"] = clean_string_column(df["Type of Housing Stock"])
-    df["UNIT"] = clean_string_column(df["UNIT"])
+    clean_string_columns(df, STRING_COLS)
 
     df["VALUE"] = clean_numeric_column(df["VALUE"])
-    df = df.dropna(subset=["VALUE"]).copy()
+    df["Year"] = parse_census_years(df["Census Year"])
 
-    df = map_regions(df, "Ireland and Northern Ireland", "Region")
-
-    df["Year"] = df["Census Year"].apply(parse_census_year).astype(int)
-    df = df[df["Year"] == TARGET_YEAR].copy()
-    if df.empty:
+    #one combined filter: missing values, other census years and totals (not part of composition)
+    in_year = df["Year"] == TARGET_YEAR
+    if not in_year.any():
         raise ValueError(f"No rows remain after filtering to Year == {TARGET_YEAR}.")
+    df = df[df["VALUE"].notna() & in_year & ~df["Type of Housing Stock"].isin(DROP_LABELS)]
 
-    #drop totals (not part of composition)
-    if DROP_LABELS:
-        df = df[~df["Type of Housing Stock"].isin(DROP_LABELS)].copy()
+    df = map_regions(df, "Ireland and Northern Ireland", "Region")
 
-    df["Occupancy"] = df["Type of Housing Stock"].apply(_normalise_occupancy)
+    #classify each distinct label once, then broadcast by code
+    codes, labels = pd.factorize(df["Type of Housing Stock"], use_na_sentinel=False)
+    df["Occupancy"] = labels.map(_normalise_occupancy).to_numpy()[codes]
 
     # keep both % and Number, pivot UNIT -> columns
-    unit_map = {"%": "Percentage", "Number": "Absolute"}
-    df["UNIT_M"] = df["UNIT"].map(unit_map)
-    if df["UNIT_M"].isna().any():
-        bad = sorted(df.loc[df["UNIT_M"].isna(), "UNIT"].unique())
-        raise ValueError(f"Unexpected UNIT values encountered: {bad}")
-
-    out = (
-        df[["Year", "Region", "Occupancy", "UNIT_M", "VALUE"]]
-        .rename(columns={"UNIT_M": "unit", "VALUE": "value"})
-        .pivot_table(
-            index=["Year", "Region", "Occupancy"],
-            columns="unit",
-            values="value",
-            aggfunc="sum",
-        )
-        .reset_index()
-    )
-
-    if "Percentage" not in out.columns or "Absolute" not in out.columns:
-        raise ValueError(f"Expected both Percentage and Absolute after pivot; got: {list(out.columns)}")
-
-    out["Percentage"] = pd.to_numeric(out["Percentage"], errors="coerce")
-    out["Absolute"] = pd.to_numeric(out["Absolute"], errors="coerce")
-
-    if out[["Percentage", "Absolute"]].isna().any().any():
-        raise ValueError("Found NaNs in Percentage/Absolute after pivot + coercion")
-
-    out["Absolute"] = out["Absolute"].round(0).astype(int)
-
-    out = (
-        out.sort_values(["Year", "Region", "Occupancy"])
-        .reset_index(drop=True)[["Year", "Region", "Occupancy", "Percentage", "Absolute"]]
-    )
+    out = pivot_units(df, ["Year", "Region", "Occupancy"])
+    out = out[["Year", "Region", "Occupancy", "Percentage", "Absolute"]]
 
     #sanity check: percentages should sum to ~100 per region (for the selected year)
-    check = out.groupby("Region")["Percentage"].sum().round(1)
-    if not all(check.between(99.5, 100.5)):
-        raise ValueError(f"Occupancy percentages do not sum to 100 by region: {check.to_dict()}")
+    check_percentage_totals(out, ["Region"], "Occupancy", low=99.5, high=100.5, expected="100")
 
     return out
 
@@ -123,10 +96,14 @@ def main() -> None:
     CLEAN_DIR.mkdir(parents=True, exist_ok=True)
 
     raw_path = latest_timestamped_file(RAW_DIR, TABLE_PREFIX)
+
+    if skip_if_current(PARQUET_PATH, raw_path, Path(__file__)):
+        return
+
     cleaned = clean_housing_occupancy(raw_path)
 
-    cleaned.to_csv(OUT_PATH, index=False)
-    print(f"Wrote {len(cleaned)} rows to {OUT_PATH}")
+    write_cleaned_table(cleaned, OUT_PATH)
+    print(f"Wrote {len(cleaned)} rows to {OUT_PATH} (+ {PARQUET_PATH.name})")
 
 
 if __name__ == "__main__":
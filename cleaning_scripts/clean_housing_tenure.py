@@ -10,12 +10,10 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 import pandas as pd
 
 from utils.cleaning import (
-    ensure_cols,
     latest_timestamped_file,
-    parse_census_year,
-    map_regions,
-    clean_string_column,
-    clean_numeric_column,
+    load_cpni,
+    skip_if_current,
+    write_cleaned_table,
 )
 
 #constants
@@ -24,6 +22,7 @@ CLEAN_DIR = Path("data/cleaned/social_indicators")
 
 TABLE_PREFIX = "CPNI34"
 OUT_PATH = CLEAN_DIR / "housing_tenure.csv"
+PARQUET_PATH = OUT_PATH.with_suffix(".parquet")
 
 TARGET_YEAR = 2022
 
@@ -35,61 +34,46 @@ REQUIRED_COLS: List[str] = [
     "VALUE",
 ]
 
+STRING_COLS: List[str] = [
+    "Ireland and Northern Ireland",
+    "Nature of Occupancy",
+    "UNIT",
+]
+
 #drop totals / non-distribution rows if present
 DROP_NATURE = {"All types of occupancy"}
 
 
 def clean_housing_tenure(raw_path: Path) -> pd.DataFrame:
-    df = pd.read_csv(raw_path)
-    ensure_cols(df, REQUIRED_COLS)
-
-    #basic cleaning
-    df["Census Year"] = clean_string_column(df["Census Year"])
-    df["Ireland and Northern Ireland"] = clean_string_column(df["Ireland and Northern Ireland"])
-    df["Nature of Occupancy"] = clean_string_column(df["Nature of Occupancy"])
-    df["UNIT"] = clean_string_column(df["UNIT"])
-
-    df["VALUE"] = clean_numeric_column(df["VALUE"])
-    df = df.dropna(subset=["VALUE"]).copy()
-
-    #map regions
-    df = map_regions(df, "Ireland and Northern Ireland", "Region")
+    df = load_cpni(raw_path, REQUIRED_COLS, STRING_COLS)
 
-    #year handling
-    df["Year"] = df["Census Year"].apply(parse_census_year).astype(int)
-    df = df[df["Year"] == TARGET_YEAR].copy()
-    if df.empty:
+    #one combined filter: other census years and totals
+    in_year = df["Year"] == TARGET_YEAR
+    if not in_year.any():
         raise ValueError(f"No rows remain after filtering to Year == {TARGET_YEAR}.")
+    df = df[in_year & ~df["Nature of Occupancy"].isin(DROP_NATURE)]
 
     # rename category
     df = df.rename(columns={"Nature of Occupancy": "Nature"})
 
-    #drop totals if present
-    if DROP_NATURE:
-        df = df[~df["Nature"].isin(DROP_NATURE)].copy()
-
-    #split percentage and absolute
-    unit_pct = df[df["UNIT"].eq("%")].copy()
-    unit_num = df[df["UNIT"].str.lower().eq("number")].copy()
-
-    unit_pct = unit_pct.rename(columns={"VALUE": "Percentage"})
-    unit_num = unit_num.rename(columns={"VALUE": "Absolute"})
-
-    out = unit_pct[["Year", "Region", "Nature", "Percentage"]].merge(
-        unit_num[["Year", "Region", "Nature", "Absolute"]],
-        on=["Year", "Region", "Nature"],
-        how="outer",
+    #pivot UNIT -> columns in one groupby + unstack; the mean doubles as the safety dedupe
+    #and units other than % / Number are dropped, as before
+    unit_map = {"%": "Percentage", "number": "Absolute"}
+    out = (
+        df.assign(UNIT_M=df["UNIT"].str.lower().map(unit_map))
+        .dropna(subset=["UNIT_M"])
+        .astype({"Region": "category", "Nature": "category", "UNIT_M": "category"})
+        .groupby(["Year", "Region", "Nature", "UNIT_M"], observed=True, sort=True)["VALUE"]
+        .mean()
+        .unstack("UNIT_M")
+        .reindex(columns=["Percentage", "Absolute"])
+        .reset_index()
+        .rename_axis(None, axis=1)
     )
 
     if out["Percentage"].isna().all() and out["Absolute"].isna().all():
         raise ValueError("No usable rows found after splitting by UNIT ('%' and 'Number').")
 
-    #safety dedupe
-    out = out.groupby(["Year", "Region", "Nature"], as_index=False).agg(
-        {"Percentage": "mean", "Absolute": "mean"}
-    )
-
-    out = out.sort_values(["Year", "Region", "Nature"]).reset_index(drop=True)
     return out
 
 
@@ -97,10 +81,14 @@ def main() -> None:
     CLEAN_DIR.mkdir(parents=True, exist_ok=True)
 
     raw_path = latest_timestamped_file(RAW_DIR, TABLE_PREFIX)
+
+    if skip_if_current(PARQUET_PATH, raw_path, Path(__file__)):
+        return
+
     cleaned = clean_housing_tenure(raw_path)
 
-    cleaned.to_csv(OUT_PATH, index=False)
-    print(f"Wrote {len(cleaned)} rows to {OUT_PATH}")
+    write_cleaned_table(cleaned, OUT_PATH)
+    print(f"Wrote {len(cleaned)} rows to {OUT_PATH} (+ {PARQUET_PATH.name})")
 
 
 if __name__ == "__main__":
@@ -7,15 +7,16 @@ from typing import List
 # Add project root to path for utils import
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
+import numpy as np
 import pandas as pd
 
 from utils.cleaning import (
-    ensure_cols,
+    check_percentage_totals,
     latest_timestamped_file,
-    parse_census_year,
-    map_regions,
-    clean_string_column,
-    clean_numeric_column,
+    load_cpni,
+    pivot_units,
+    skip_if_current,
+    write_cleaned_table,
 )
 
 #constants
@@ -24,6 +25,7 @@ CLEAN_DIR = Path("data/cleaned/social_indicators")
 
 TABLE_PREFIX = "CPNI30"
 OUT_PATH = CLEAN_DIR / "housing_type.csv"
+PARQUET_PATH = OUT_PATH.with_suffix(".parquet")
 
 REQUIRED_COLS: List[str] = [
     "Statistic Label",
@@ -34,6 +36,13 @@ REQUIRED_COLS: List[str] = [
     "VALUE",
 ]
 
+STRING_COLS: List[str] = [
+    "Statistic Label",
+    "Ireland and Northern Ireland",
+    "Type of Household",
+    "UNIT",
+]
+
 #rows to drop (not part of distribution)
 DROP_TYPES = {
     "All households",
@@ -42,84 +51,32 @@ DROP_TYPES = {
     "Unspecified",
 }
 
-
-def _normalise_type(label: str) -> str:
-    s = str(label).strip()
-    low = s.lower()
-
-    #merge flat/apartment
-    if "flat" in low or "apartment" in low:
-        return "Flat / apartment"
-
-    return s
+#flat and apartment variants are reported as one category
+FLAT_PATTERN = "flat|apartment"
+FLAT_LABEL = "Flat / apartment"
 
 
 def clean_housing_type(raw_path: Path) -> pd.DataFrame:
-    df = pd.read_csv(raw_path)
-    ensure_cols(df, REQUIRED_COLS)
-
-    df["Statistic Label"] = clean_string_column(df["Statistic Label"])
-    df["Census Year"] = clean_string_column(df["Census Year"])
-    df["Ireland and Northern Ireland"] = clean_string_column(df["Ireland and Northern Ireland"])
-    df["Type of Household"] = clean_string_column(df["Type of Household"])
-    df["UNIT"] = clean_string_column(df["UNIT"])
-
-    df["VALUE"] = clean_numeric_column(df["VALUE"])
-    df = df.dropna(subset=["VALUE"]).copy()
-
-    df = map_regions(df, "Ireland and Northern Ireland", "Region")
-
-    df["Year"] = df["Census Year"].apply(parse_census_year).astype(int)
+    df = load_cpni(raw_path, REQUIRED_COLS, STRING_COLS)
     df = df.rename(columns={"Type of Household": "Type"})
 
     #drop totals and zero-information categories
-    df = df[~df["Type"].isin(DROP_TYPES)].copy()
-
-    #normalise categories
-    df["Type"] = df["Type"].apply(_normalise_type)
-
-    # keep both % and Number, pivot UNIT -> columns
-    unit_map = {"%": "Percentage", "Number": "Absolute"}
-    df["UNIT_M"] = df["UNIT"].map(unit_map)
-    if df["UNIT_M"].isna().any():
-        bad = sorted(df.loc[df["UNIT_M"].isna(), "UNIT"].unique())
-        raise ValueError(f"Unexpected UNIT values encountered: {bad}")
-
-    out = (
-        df[["Year", "Region", "Type", "UNIT_M", "VALUE"]]
-        .rename(columns={"UNIT_M": "unit", "VALUE": "value"})
-        .pivot_table(
-            index=["Year", "Region", "Type"],
-            columns="unit",
-            values="value",
-            aggfunc="sum",
-        )
-        .reset_index()
-    )
-
-    if "Percentage" not in out.columns or "Absolute" not in out.columns:
-        raise ValueError(f"Expected both Percentage and Absolute after pivot; got: {list(out.columns)}")
-
-    out["Percentage"] = pd.to_numeric(out["Percentage"], errors="coerce")
-    out["Absolute"] = pd.to_numeric(out["Absolute"], errors="coerce")
-
-    if out[["Percentage", "Absolute"]].isna().any().any():
-        raise ValueError("Found NaNs in Percentage/Absolute after pivot + coercion")
-
-    out["Absolute"] = out["Absolute"].round(0).astype(int)
-
-    #re-aggregate after merging categories (pivot already sums; this is just for safety if duplicates exist)
-    out = (
-        out.groupby(["Year", "Region", "Type"], as_index=False)[["Percentage", "Absolute"]]
-        .sum()
-        .sort_values(["Year", "Region", "Type"])
-        .reset_index(drop=True)
-    )
+    df = df[~df["Type"].isin(DROP_TYPES)]
+
+    #normalise categories: merge flat/apartment variants with one vectorised match over the
+    #distinct labels, then broadcast by code
+    codes, labels = pd.factorize(df["Type"], use_na_sentinel=False)
+    labels = pd.Index(labels, dtype="string")
+    is_flat = labels.str.contains(FLAT_PATTERN, case=False, regex=True, na=False)
+    df["Type"] = np.where(is_flat, FLAT_LABEL, labels.to_numpy(dtype=object))[codes]
+
+    # keep both % and Number, pivot UNIT -> columns; grouping on the normalised Type
+    # already sums the merged flat/apartment rows, one row per Year/Region/Type
+    out = pivot_units(df, ["Year", "Region", "Type"])
+    out = out[["Year", "Region", "Type", "Percentage", "Absolute"]]
 
     #sanity check: percentages should sum to ~100 per region/year
-    check = out.groupby(["Region", "Year"])["Percentage"].sum().round(1)
-    if not all(check.between(99.0, 101.0)):
-        raise ValueError(f"Housing type percentages do not sum to ~100 by region/year: {check.to_dict()}")
+    check_percentage_totals(out, ["Region", "Year"], "Housing type")
 
     return out
 
@@ -128,10 +85,14 @@ def main() -> None:
     CLEAN_DIR.mkdir(parents=True, exist_ok=True)
 
     raw_path = latest_timestamped_file(RAW_DIR, TABLE_PREFIX)
+
+    if skip_if_current(PARQUET_PATH, raw_path, Path(__file__)):
+        return
+
     cleaned = clean_housing_type(raw_path)
 
-    cleaned.to_csv(OUT_PATH, index=False)
-    print(f"Wrote {len(cleaned)} rows to {OUT_PATH}")
+    write_cleaned_table(cleaned, OUT_PATH)
+    print(f"Wrote {len(cleaned)} rows to {OUT_PATH} (+ {PARQUET_PATH.name})")
 
 
 if __name__ == "__main__":
@@ -7,15 +7,18 @@ from typing import List
 # Add project root to path for utils import
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
+import numpy as np
 import pandas as pd
 
 from utils.cleaning import (
-    ensure_cols,
+    read_raw_csv,
     latest_timestamped_file,
-    parse_census_year,
+    parse_census_years,
     map_regions,
-    clean_string_column,
+    clean_string_columns,
     clean_numeric_column,
+    skip_if_current,
+    write_cleaned_table,
 )
 
 #constants
@@ -24,6 +27,7 @@ CLEAN_DIR = Path("data/cleaned/economy")
 
 TABLE_PREFIX = "CPNI35"
 OUT_PATH = CLEAN_DIR / "labour_market_snapshot.csv"
+PARQUET_PATH = OUT_PATH.with_suffix(".parquet")
 
 REQUIRED_COLS: List[str] = [
     "Statistic Label",
@@ -35,17 +39,31 @@ REQUIRED_COLS: List[str] = [
     "VALUE",
 ]
 
+STRING_COLS: List[str] = [
+    "Statistic Label",
+    "Ireland and Northern Ireland",
+    "Sex",
+    "Principal Economic Status",
+    "UNIT",
+]
+
+CATEGORY_COLS: List[str] = ["Statistic Label", "Sex", "Principal Economic Status", "UNIT"]
+
+#(Principal Economic Status, UNIT) pairs every Year/Region must provide
+REQUIRED_SERIES: List[tuple[str, str]] = [
+    ("Persons at work", "Number"),
+    ("All unemployed persons", "Number"),
+    ("Persons at work", "%"),
+    ("All unemployed persons", "%"),
+]
+
 
 def clean_labour_market_snapshot(raw_path: Path) -> pd.DataFrame:
-    df = pd.read_csv(raw_path)
-    ensure_cols(df, REQUIRED_COLS)
-
-    df["Statistic Label"] = clean_string_column(df["Statistic Label"])
-    df["Census Year"] = clean_string_column(df["Census Year"])
-    df["Ireland and Northern Ireland"] = clean_string_column(df["Ireland and Northern Ireland"])
-    df["Sex"] = clean_string_column(df["Sex"])
-    df["Principal Economic Status"] = clean_string_column(df["Principal Economic Status"])
-    df["UNIT"] = clean_string_column(df["UNIT"])
+    df = read_raw_csv(raw_path, REQUIRED_COLS)
+
+    clean_string_columns(df, STRING_COLS)
+    #low-cardinality labels as categoricals: the filters and the pivot below work on integer codes
+    df = df.astype({col: "category" for col in CATEGORY_COLS})
     df["VALUE"] = clean_numeric_column(df["VALUE"])
 
     df = df.dropna(subset=["VALUE"])
@@ -54,15 +72,14 @@ def clean_labour_market_snapshot(raw_path: Path) -> pd.DataFrame:
     df = map_regions(df, "Ireland and Northern Ireland", "Region")
 
     #align year
-    df["Year"] = df["Census Year"].apply(parse_census_year).astype(int)
+    df["Year"] = parse_census_years(df["Census Year"])
 
     #we want the 16+ usual resident base (numbers) and its percentage form
-    #statistic labels differ, so filter by contains rather than exact match
-    stat_keep = (
-        df["Statistic Label"].str.contains("Population usually resident age 16 years and over", case=False, na=False)
-        | df["Statistic Label"].str.contains("Percentage of Population usually resident age 16 years and over", case=False, na=False)
-    )
-    df = df[stat_keep]
+    #statistic labels differ, so match by substring (the percentage label contains the base one),
+    #decided once per distinct label and applied with a hash lookup
+    labels = df["Statistic Label"].cat.categories
+    keep_labels = labels[labels.str.contains("Population usually resident age 16 years and over", case=False, regex=False)]
+    df = df[df["Statistic Label"].isin(keep_labels)]
 
     #we only need both sexes for the dashboard toggle
     df = df[df["Sex"] == "Both sexes"]
@@ -76,48 +93,38 @@ def clean_labour_market_snapshot(raw_path: Path) -> pd.DataFrame:
     if bad_units:
         raise ValueError(f"Unexpected UNIT values: {bad_units}. Expected only 'Number' and '%'.")
 
-    #build rows per Region/Year
-    rows = []
-    for (year, region), g in df.groupby(["Year", "Region"]):
-        employed_n = g.loc[
-            (g["Principal Economic Status"] == "Persons at work") & (g["UNIT"] == "Number"),
-            "VALUE",
-        ]
-        unemployed_n = g.loc[
-            (g["Principal Economic Status"] == "All unemployed persons") & (g["UNIT"] == "Number"),
-            "VALUE",
-        ]
-        employed_pct = g.loc[
-            (g["Principal Economic Status"] == "Persons at work") & (g["UNIT"] == "%"),
-            "VALUE",
-        ]
-        unemployed_pct = g.loc[
-            (g["Principal Economic Status"] == "All unemployed persons") & (g["UNIT"] == "%"),
-            "VALUE",
-        ]
-
-        #these four should exist for each region
-        if employed_n.empty or unemployed_n.empty or employed_pct.empty or unemployed_pct.empty:
-            raise ValueError(
-                f"CPNI35 missing expected rows for Year={year}, Region={region}. "
-                f"Need Persons at work + All unemployed persons for both Number and %."
-            )
-
-        labour_force_n = float(employed_n.iloc[0]) + float(unemployed_n.iloc[0])
-
-        rows.append(
-            {
-                "Year": int(year),
-                "Region": region,
-                "Employed (16+)": int(round(float(employed_n.iloc[0]))),
-                "Unemployed (16+)": int(round(float(unemployed_n.iloc[0]))),
-                "Labour force (16+)": int(round(labour_force_n)),
-                "Employment share (%)": float(employed_pct.iloc[0]),
-                "Unemployment rate (%)": float(unemployed_pct.iloc[0]),
-            }
+    #one reshape: a row per Year/Region, a column per (status, unit); "first" keeps the first matching row
+    piv = df.pivot_table(
+        index=["Year", "Region"],
+        columns=["Principal Economic Status", "UNIT"],
+        values="VALUE",
+        aggfunc="first",
+        observed=True,
+    ).reindex(columns=REQUIRED_SERIES)
+
+    #these four should exist for each region
+    missing = piv.isna().any(axis=1)
+    if missing.any():
+        year, region = missing[missing].index[0]
+        raise ValueError(
+            f"CPNI35 missing expected rows for Year={year}, Region={region}. "
+            f"Need Persons at work + All unemployed persons for both Number and %."
         )
 
-    out = pd.DataFrame(rows).sort_values(["Region", "Year"]).reset_index(drop=True)
+    employed_n = piv[("Persons at work", "Number")].to_numpy(dtype="float64")
+    unemployed_n = piv[("All unemployed persons", "Number")].to_numpy(dtype="float64")
+
+    out = pd.DataFrame(
+        {
+            "Employed (16+)": np.rint(employed_n).astype("int64"),
+            "Unemployed (16+)": np.rint(unemployed_n).astype("int64"),
+            "Labour force (16+)": np.rint(employed_n + unemployed_n).astype("int64"),
+            "Employment share (%)": piv[("Persons at work", "%")].to_numpy(dtype="float64"),
+            "Unemployment rate (%)": piv[("All unemployed persons", "%")].to_numpy(dtype="float64"),
+        },
+        index=piv.index,
+    ).reset_index()
+    out = out.sort_values(["Region", "Year"]).reset_index(drop=True)
 
     #sanity: rates should sum to ~100
     out["Sum check (%)"] = (out["Employment share (%)"] + out["Unemployment rate (%)"]).round(1)
@@ -136,10 +143,14 @@ def main() -> None:
     CLEAN_DIR.mkdir(parents=True, exist_ok=True)
 
     raw_path = latest_timestamped_file(RAW_DIR, TABLE_PREFIX)
+
+    if skip_if_current(PARQUET_PATH, raw_path, Path(__file__)):
+        return
+
     cleaned = clean_labour_market_snapshot(raw_path)
 
-    cleaned.to_csv(OUT_PATH, index=False)
-    print(f"Wrote {len(cleaned)} rows to {OUT_PATH}")
+    write_cleaned_table(cleaned, OUT_PATH)
+    print(f"Wrote {len(cleaned)} rows to {OUT_PATH} (+ {PARQUET_PATH.name})")
 
 
 if __name__ == "__main__":
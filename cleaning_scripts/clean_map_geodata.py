@@ -0,0 +1,72 @@
+import geopandas as gpd
+import orjson
+import pandas as pd
+import shapely
+from pathlib import Path
+
+#pre-simplifies the GeoJSON shown on the Overview map so the browser only
+#receives the vertices it can actually draw at island/county zoom levels.
+#output goes to Streamlit's static folder (served at app/static/...) so the
+#browser fetches and caches it instead of it being inlined into the map HTML
+
+RAW_DIR = Path("data/raw/geojson")
+STATIC_DIR = Path("static/geojson")
+
+#merged file -> [(raw file, jurisdiction, property holding the feature's name)]
+#ROI + NI go into one file per view so the browser makes a single fetch/parse
+#all raw files are already WGS84
+MAP_FILES = {
+    "island_simplified.geojson": [
+        ("ie.json", "Republic of Ireland", "name"),
+        ("northern_ireland.geojson", "Northern Ireland", "CountyName"),
+    ],
+    "island_county_simplified.geojson": [
+        ("ie_county.json", "Republic of Ireland", "name"),
+        ("ni_county.geojson", "Northern Ireland", "CountyName"),
+    ],
+}
+
+#simplification tolerance in degrees (~50m), keeps shared county borders intact
+SIMPLIFY_TOLERANCE = 0.0005
+#5 d.p. is ~1m precision, plenty for a national-scale map
+COORDINATE_PRECISION = 5
+
+
+def write_geojson(gdf: gpd.GeoDataFrame, out_path: Path) -> None:
+    #rounds in one vectorised pass then encodes with orjson, skipping the slower GDAL writer
+    gdf = gdf.copy()
+    gdf["geometry"] = shapely.transform(gdf.geometry.values, lambda coords: coords.round(COORDINATE_PRECISION))
+    with open(out_path, "wb") as file:
+        file.write(orjson.dumps(
+            gdf.to_geo_dict(),
+            option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_APPEND_NEWLINE,
+        ))
+
+
+STATIC_DIR.mkdir(parents=True, exist_ok=True)
+
+for clean_name, sources in MAP_FILES.items():
+    frames = []
+    for raw_name, jurisdiction, name_col in sources:
+        gdf = gpd.read_file(RAW_DIR / raw_name)
+        gdf["geometry"] = gdf.geometry.simplify(SIMPLIFY_TOLERANCE, preserve_topology=True)
+
+        #tooltip/style fields, baked in because the browser reads this file directly
+        if name_col in gdf.columns:
+            gdf["display_name"] = gdf[name_col].fillna("").astype(str).str.title()
+        else:
+            gdf["display_name"] = ""
+        gdf["jurisdiction"] = jurisdiction
+        frames.append(gdf[["jurisdiction", "display_name", "geometry"]])
+
+    #fresh index -> unique feature ids, which folium needs to style a URL-loaded layer
+    merged = gpd.GeoDataFrame(pd.concat(frames, ignore_index=True), crs=frames[0].crs)
+
+    out_path = STATIC_DIR / clean_name
+    write_geojson(merged, out_path)
+
+    raw_kb = sum((RAW_DIR / raw_name).stat().st_size for raw_name, _, _ in sources) / 1024
+    clean_kb = out_path.stat().st_size / 1024
+    print(f"{len(sources)} raw files ({raw_kb:,.0f} KB) -> {out_path} ({clean_kb:,.0f} KB)")
+
+#NOTE this script only has to be re-run when the raw boundaries change
@@ -13,17 +13,23 @@ from typing import Final
 # Add project root to path for utils import
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
+import numpy as np
 import pandas as pd
 
 from utils.cleaning import (
     get_project_root,
     find_raw_file,
+    read_cso_csv,
+    load_population_weights,
     map_regions,
-    clean_string_column,
+    weighted_group_mean,
+    clean_string_columns,
     clean_numeric_column,
+    write_cleaned_table,
     ROI_LABEL,
     NI_LABEL,
     ALL_LABEL,
+    REGION_DTYPE,
 )
 
 #constants
@@ -42,66 +48,31 @@ FILTER_UNIT: Final[str] = "Number"
 
 
 
-#load population weights
-def load_population_over_time(clean_dir: Path) -> pd.DataFrame:
-    path = clean_dir / POP_TIME_CLEAN_FILENAME
-    if not path.exists():
-        raise FileNotFoundError(
-            f"Missing {POP_TIME_CLEAN_FILENAME}; required for All-Island weighting."
-        )
-
-    pop = pd.read_csv(path)
-
-    if not {"Year", "Region", "Population"}.issubset(pop.columns):
-        raise ValueError(
-            "population_over_time.csv must contain Year, Region, Population"
-        )
-
-    pop["Year"] = pd.to_numeric(pop["Year"], errors="coerce").astype(int)
-    pop["Population"] = pd.to_numeric(pop["Population"], errors="coerce").astype(int)
-    pop["Region"] = pop["Region"].astype(str).str.strip()
-
-    pop = pop[pop["Region"].isin([ROI_LABEL, NI_LABEL])]
-
-    if pop.duplicated(subset=["Year", "Region"]).any():
-        pop = pop.groupby(["Year", "Region"], as_index=False)["Population"].sum()
-
-    return pop
-
-
-
 #cleaner
 
 def clean_median_age_over_time(
     raw_path: Path, pop_time: pd.DataFrame
 ) -> pd.DataFrame:
-    df = pd.read_csv(raw_path)
-
-    col_stat = next(
-        (c for c in df.columns if c.strip().lower() == "statistic label"), None
-    )
-    col_year = next((c for c in df.columns if c.strip().lower() == "year"), None)
-    col_region = next(
-        (c for c in df.columns if c.strip().lower() in {"region", "ireland and northern ireland"}),
-        None,
+    out, cols = read_cso_csv(
+        raw_path,
+        {
+            "stat": ("statistic label",),
+            "year": ("year",),
+            "region": ("region", "ireland and northern ireland"),
+            "unit": ("unit",),
+            "value": ("value", "values"),
+        },
+        required=["stat", "year", "region", "unit", "value"],
+        what="CPNI03 export",
     )
-    col_unit = next((c for c in df.columns if c.strip().lower() == "unit"), None)
-    col_value = next(
-        (c for c in df.columns if c.strip().lower() in {"value", "values"}), None
-    )
-
-    required = [col_stat, col_year, col_region, col_unit, col_value]
-    if any(c is None for c in required):
-        raise ValueError(
-            "Could not identify required columns in CPNI03 export.\n"
-            f"Columns found: {list(df.columns)}"
-        )
+    col_stat, col_year, col_region = cols["stat"], cols["year"], cols["region"]
+    col_unit, col_value = cols["unit"], cols["value"]
 
-    out = df.copy()
+    #strip each label column once (arrow kernel); the filter and region mapping reuse it
+    clean_string_columns(out, [col_stat, col_unit, col_region])
 
     #filter to median age (overall)
-    out = out[out[col_stat].astype(str).str.strip().eq(FILTER_STATISTIC_LABEL)]
-    out = out[out[col_unit].astype(str).str.strip().eq(FILTER_UNIT)]
+    out = out[out[col_stat].eq(FILTER_STATISTIC_LABEL) & out[col_unit].eq(FILTER_UNIT)]
 
     out = out.rename(
         columns={
@@ -111,7 +82,6 @@ def clean_median_age_over_time(
         }
     )
 
-    out["Region"] = clean_string_column(out["Region"])
     out = map_regions(out, "Region", "Region")
 
     out["Year"] = pd.to_numeric(out["Year"], errors="coerce").astype(int)
@@ -120,43 +90,28 @@ def clean_median_age_over_time(
     out = out.dropna(subset=["Year", "Median age"])
     out = out[out["Region"].isin([ROI_LABEL, NI_LABEL])]
 
-    if out.duplicated(subset=["Year", "Region"]).any():
-        out = out.groupby(["Year", "Region"], as_index=False)["Median age"].mean()
+    #one pass: a no-op collapse on unique keys, a mean where a year/region repeats
+    out = out.groupby(["Year", "Region"], as_index=False, sort=False, observed=True)["Median age"].mean()
 
     # All-Island derivation (population-weighted)
-    weights = (
-        pop_time.pivot(index="Year", columns="Region", values="Population")
-        .rename(columns={ROI_LABEL: "ROI_pop", NI_LABEL: "NI_pop"})
-        .reset_index()
-    )
-    weights["Total_pop"] = weights["ROI_pop"] + weights["NI_pop"]
-
-    tmp = out.merge(weights, on="Year", how="left")
-
-    def weighted_all_island(group: pd.DataFrame) -> float:
-        roi = group[group["Region"] == ROI_LABEL]
-        ni = group[group["Region"] == NI_LABEL]
-
-        if roi.empty or ni.empty:
-            return float(group["Median age"].mean())
-
-        total = group["Total_pop"].iloc[0]
-        if pd.isna(total) or total <= 0:
-            return float(group["Median age"].mean())
-
-        return float(
-            (roi["Median age"].iloc[0] * group["ROI_pop"].iloc[0]
-             + ni["Median age"].iloc[0] * group["NI_pop"].iloc[0])
-            / total
-        )
-
-    all_island = (
-        tmp.groupby("Year", as_index=False)
-        .apply(lambda g: pd.Series({"Median age": weighted_all_island(g)}))
-        .reset_index(drop=True)
-    )
-    all_island["Region"] = ALL_LABEL
-
+    #one bincount pass over the (Year, Region) rows, the kernel the dependency cleaner uses:
+    #weighted mean where both regions report with a positive total, plain mean otherwise
+    #population looked up per row on the (Year, Region) index, no joined frame
+    populations = pop_time.set_index(["Year", "Region"])["Population"]
+    pop = populations.reindex(pd.MultiIndex.from_frame(out[["Year", "Region"]])).to_numpy(dtype="float64")
+    codes, years = pd.factorize(out["Year"], sort=True)
+    age = out["Median age"].to_numpy(dtype="float64")
+
+    weighted, total_pop = weighted_group_mean(codes, age, pop, len(years))
+    counts = np.bincount(codes, minlength=len(years))
+    plain = np.bincount(codes, weights=age, minlength=len(years)) / counts
+    usable = (counts == 2) & ~np.isnan(weighted) & (total_pop > 0)
+
+    all_island = pd.DataFrame({"Year": years, "Median age": np.where(usable, weighted, plain)})
+    all_island["Region"] = pd.Categorical([ALL_LABEL] * len(years), dtype=REGION_DTYPE)
+
+    #same columns and Region dtype on both sides keeps the concat a plain block copy
+    out = out[["Year", "Region", "Median age"]].astype({"Region": REGION_DTYPE})
     out = pd.concat([out, all_island], ignore_index=True)
 
     #final rounding
@@ -176,12 +131,12 @@ def main() -> None:
     clean_dir.mkdir(parents=True, exist_ok=True)
 
     raw_path = find_raw_file(raw_dir, RAW_FILE_PREFIX)
-    pop_time = load_population_over_time(clean_dir)
+    pop_time = load_population_weights(clean_dir / POP_TIME_CLEAN_FILENAME)
 
     cleaned = clean_median_age_over_time(raw_path, pop_time)
 
     out_path = clean_dir / CLEAN_FILENAME
-    cleaned.to_csv(out_path, index=False)
+    write_cleaned_table(cleaned, out_path)
 
     print(f"Read raw:  {raw_path}")
     print(f"Wrote:     {out_path}")
@@ -13,12 +13,14 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 import pandas as pd
 
 from utils.cleaning import (
-    ensure_cols,
+    read_raw_csv,
     latest_timestamped_file,
-    parse_census_year,
+    parse_census_years,
     map_regions,
     clean_string_column,
     clean_numeric_column,
+    pivot_units,
+    write_cleaned_table,
 )
 
 #constants
@@ -41,11 +43,10 @@ DROP_COUNTRIES = {"All countries"}
 
 
 def clean_migration(raw_path: Path) -> pd.DataFrame:
-    df = pd.read_csv(raw_path)
-    ensure_cols(df, REQUIRED_COLS)
+    df = read_raw_csv(raw_path, REQUIRED_COLS)
     
     #filter out aggregate
-    df = df[~df["Top 10 Places of Birth"].isin(DROP_COUNTRIES)].copy()
+    df = df[~df["Top 10 Places of Birth"].isin(DROP_COUNTRIES)]
     
     #clean string columns
     df["Census Year"] = clean_string_column(df["Census Year"])
@@ -55,49 +56,20 @@ def clean_migration(raw_path: Path) -> pd.DataFrame:
     
     #clean numeric column
     df["VALUE"] = clean_numeric_column(df["VALUE"])
-    df = df.dropna(subset=["VALUE"]).copy()
+    df = df.dropna(subset=["VALUE"])
     
     #map regions
     df = map_regions(df, "Ireland and Northern Ireland", "Region")
     
     #parse census year
-    df["Year"] = df["Census Year"].apply(parse_census_year).astype(int)
+    df["Year"] = parse_census_years(df["Census Year"])
     
     #rename for clarity
     df = df.rename(columns={"Top 10 Places of Birth": "Country"})
     
-    #validate units
-    unit_map = {"%": "Percentage", "Number": "Absolute"}
-    df["UNIT_M"] = df["UNIT"].map(unit_map)
-    if df["UNIT_M"].isna().any():
-        bad = sorted(df.loc[df["UNIT_M"].isna(), "UNIT"].unique())
-        raise ValueError(f"Unexpected UNIT values encountered: {bad}")
-    
-    #pivot UNIT -> columns
-    out = (
-        df[["Year", "Region", "Country", "UNIT_M", "VALUE"]]
-        .rename(columns={"UNIT_M": "unit", "VALUE": "value"})
-        .pivot_table(
-            index=["Year", "Region", "Country"],
-            columns="unit",
-            values="value",
-            aggfunc="first",
-        )
-        .reset_index()
-    )
-    
-    if "Percentage" not in out.columns or "Absolute" not in out.columns:
-        raise ValueError(f"Expected both Percentage and Absolute after pivot; got: {list(out.columns)}")
-    
-    out["Percentage"] = pd.to_numeric(out["Percentage"], errors="coerce")
-    out["Absolute"] = pd.to_numeric(out["Absolute"], errors="coerce")
-    
-    if out[["Percentage", "Absolute"]].isna().any().any():
-        raise ValueError("Found NaNs in Percentage/Absolute after pivot + coercion")
-    
-    out["Absolute"] = out["Absolute"].round(0).astype(int)
-    
-    out = out.sort_values(["Year", "Region", "Country"]).reset_index(drop=True)
+    #validate units and pivot UNIT -> columns; each key/unit pair is unique, so a plain
+    #unstack with no aggregation pass (duplicates raise instead of being dropped)
+    out = pivot_units(df, ["Year", "Region", "Country"], aggfunc=None)
     
     return out
 
@@ -108,7 +80,7 @@ def main() -> None:
     raw_path = latest_timestamped_file(RAW_DIR, TABLE_PREFIX)
     cleaned = clean_migration(raw_path)
     
-    cleaned.to_csv(OUT_PATH, index=False)
+    write_cleaned_table(cleaned, OUT_PATH)
     print(f"✅ Wrote {len(cleaned)} rows to {OUT_PATH}")
 
 
@@ -14,15 +14,20 @@ from typing import Final
 # Add project root to path for utils import
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
+import numpy as np
 import pandas as pd
 
 from utils.cleaning import (
     get_project_root,
     find_raw_file,
+    read_cso_csv,
+    clean_string_columns,
+    write_cleaned_table,
     STANDARD_REGION_MAP,
     ROI_LABEL,
     NI_LABEL,
     ALL_LABEL,
+    REGION_DTYPE,
 )
 
 #constants to edit
@@ -41,22 +46,27 @@ FILTER_SEX: Final[str | None] = None  # e.g. "Both sexes" if you want totals onl
 
 ADD_ALL_ISLAND: Final[bool] = True
 
+#age band patterns, compiled once rather than looked up per row
+_WHITESPACE_RE: Final[re.Pattern[str]] = re.compile(r"\s+")
+_NUMBER_RE: Final[re.Pattern[str]] = re.compile(r"\d+")
+_RANGE_RE: Final[re.Pattern[str]] = re.compile(r"^(\d{1,3})\s*-\s*(\d{1,3})$")
+
 
 #age band normalisation
 def normalise_age_band(raw: str) -> str:
     s = str(raw).strip().lower()
-    s = re.sub(r"\s+", " ", s)
+    s = _WHITESPACE_RE.sub(" ", s)
 
     if "85" in s and ("over" in s or "and" in s or "+" in s):
         return "85+"
 
-    nums = re.findall(r"\d+", s)
+    nums = _NUMBER_RE.findall(s)
     if len(nums) >= 2:
         a = int(nums[0])
         b = int(nums[1])
         return f"{a}-{b}"
 
-    m = re.match(r"^(\d{1,3})\s*-\s*(\d{1,3})$", s)
+    m = _RANGE_RE.match(s)
     if m:
         return f"{int(m.group(1))}-{int(m.group(2))}"
 
@@ -80,41 +90,33 @@ def ensure_age_band_order(df: pd.DataFrame) -> pd.DataFrame:
 
 #cleaner
 def clean_population_distribution(raw_path: Path) -> pd.DataFrame:
-    df: pd.DataFrame = pd.read_csv(raw_path)
-
-    # Identify columns (supports "Census Year")
-    col_stat = next((c for c in df.columns if c.strip().lower() == "statistic label"), None)
-
-    year_aliases = {"year", "census year", "censusyear", "census_year"}
-    col_year = next((c for c in df.columns if c.strip().lower() in year_aliases), None)
-
-    col_sex = next((c for c in df.columns if c.strip().lower() == "sex"), None)
-    col_region = next(
-        (c for c in df.columns if c.strip().lower() in {"ireland and northern ireland", "region"}),
-        None,
+    # Identify columns (supports "Census Year") and read only those
+    out, cols = read_cso_csv(
+        raw_path,
+        {
+            "stat": ("statistic label",),
+            "year": ("year", "census year", "censusyear", "census_year"),
+            "sex": ("sex",),
+            "region": ("ireland and northern ireland", "region"),
+            "unit": ("unit",),
+            "value": ("value", "values"),
+            "age": ("age group", "age_group", "age", "age band", "ageband"),
+        },
+        required=["year", "sex", "region", "unit", "value", "age"],
+        what="CPNI02 export",
     )
-    col_unit = next((c for c in df.columns if c.strip().lower() == "unit"), None)
-    col_value = next((c for c in df.columns if c.strip().lower() in {"value", "values"}), None)
-
-    age_aliases = {"age group", "age_group", "age", "age band", "ageband"}
-    col_age = next((c for c in df.columns if c.strip().lower() in age_aliases), None)
-
-    required = [col_year, col_sex, col_region, col_unit, col_value, col_age]
-    if any(c is None for c in required):
-        raise ValueError(
-            "Could not identify required columns in CPNI02 export.\n"
-            f"Columns found: {list(df.columns)}\n"
-            "Need at least: Year/Census Year, Sex, Age Group, Ireland and Northern Ireland/Region, UNIT, VALUE."
-        )
+    col_stat, col_year, col_sex = cols["stat"], cols["year"], cols["sex"]
+    col_region, col_unit, col_value, col_age = cols["region"], cols["unit"], cols["value"], cols["age"]
 
-    out = df.copy()
+    #strip each label column once (arrow kernel); the filters and region mapping reuse it
+    clean_string_columns(out, [c for c in (col_stat, col_sex, col_region, col_unit) if c is not None])
 
     if col_stat and FILTER_STATISTIC_LABEL is not None:
-        out = out[out[col_stat].astype(str).str.strip().eq(FILTER_STATISTIC_LABEL)]
+        out = out[out[col_stat].eq(FILTER_STATISTIC_LABEL)]
     if FILTER_SEX is not None:
-        out = out[out[col_sex].astype(str).str.strip().eq(FILTER_SEX)]
+        out = out[out[col_sex].eq(FILTER_SEX)]
     if FILTER_UNIT is not None:
-        out = out[out[col_unit].astype(str).str.strip().eq(FILTER_UNIT)]
+        out = out[out[col_unit].eq(FILTER_UNIT)]
 
     out = out.rename(
         columns={
@@ -126,32 +128,38 @@ def clean_population_distribution(raw_path: Path) -> pd.DataFrame:
         }
     )
 
-    out["Region"] = out["Region"].astype(str).str.strip().map(STANDARD_REGION_MAP).fillna(out["Region"].astype(str).str.strip())
-    out["Sex"] = out["Sex"].astype(str).str.strip()
-
-    out["Year"] = pd.to_numeric(out["Year"], errors="coerce").astype("Int64")
-    out["Population"] = pd.to_numeric(out["Population"], errors="coerce").astype("Int64")
-    out["Age band"] = out["Age band"].astype(str).map(normalise_age_band)
-
-    out = out.dropna(subset=["Year", "Population"]).copy()
-    out["Year"] = out["Year"].astype(int)
-    out["Population"] = out["Population"].astype(int)
-
-    #keep only ROI/NI (All-Island derived later)
-    out = out[out["Region"].isin([ROI_LABEL, NI_LABEL])].copy()
-
-    #remove totals if present
-    out = out[~out["Age band"].astype(str).str.lower().isin({"all ages", "total", "all"})].copy()
+    out["Region"] = out["Region"].map(STANDARD_REGION_MAP).fillna(out["Region"])
+
+    #parsed once; unparsed rows are dropped by the mask below before the int64 cast
+    out["Year"] = pd.to_numeric(out["Year"], errors="coerce")
+    out["Population"] = pd.to_numeric(out["Population"], errors="coerce")
+    #normalise each distinct band once (a couple of dozen), then broadcast by code
+    codes, bands = pd.factorize(out["Age band"].astype(str), use_na_sentinel=False)
+    out["Age band"] = bands.map(normalise_age_band).to_numpy()[codes]
+
+    #one combined mask: drop unparsed rows, keep only ROI/NI (All-Island derived later), remove totals if present
+    keep = (
+        out["Year"].notna()
+        & out["Population"].notna()
+        & out["Region"].isin([ROI_LABEL, NI_LABEL])
+        & ~out["Age band"].astype(str).str.lower().isin({"all ages", "total", "all"})
+    )
+    #low-cardinality keys as categoricals: the groupbys below hash integer codes, not strings
+    out = out[keep].astype({"Year": "int64", "Population": "int64", "Region": REGION_DTYPE, "Sex": "category"})
 
-    #de-dup by summing just in case
-    if out.duplicated(subset=["Year", "Region", "Sex", "Age band"]).any():
-        out = out.groupby(["Year", "Region", "Sex", "Age band"], as_index=False)["Population"].sum()
+    #de-dup by summing just in case, in one pass (a no-op collapse on unique keys)
+    out = out.groupby(["Year", "Region", "Sex", "Age band"], as_index=False, sort=False, observed=True)["Population"].sum()
 
     if ADD_ALL_ISLAND:
+        #factorize the (Year, Sex, Age band) keys once, then sum ROI + NI in one bincount pass
+        keys = out[["Year", "Sex", "Age band"]]
+        codes, groups = pd.factorize(pd.MultiIndex.from_frame(keys))
+        totals = np.bincount(codes, weights=out["Population"].to_numpy(dtype="float64"), minlength=len(groups))
         all_island = (
-            out.groupby(["Year", "Sex", "Age band"], as_index=False)["Population"]
-            .sum()
-            .assign(Region=ALL_LABEL)
+            groups.to_frame(index=False, name=list(keys.columns))
+            .astype(keys.dtypes.to_dict())
+            .assign(Population=totals.astype("int64"), Region=ALL_LABEL)
+            .astype({"Region": REGION_DTYPE})
         )
         out = pd.concat([out, all_island], ignore_index=True)
 
@@ -175,7 +183,7 @@ def main() -> None:
     cleaned = clean_population_distribution(raw_path)
 
     out_path = clean_dir / CLEAN_FILENAME
-    cleaned.to_csv(out_path, index=False)
+    write_cleaned_table(cleaned, out_path)
 
     print(f"Project root: {project_root}")
     print(f"Read raw:      {raw_path}")
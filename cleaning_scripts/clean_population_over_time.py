@@ -15,11 +15,15 @@ import pandas as pd
 from utils.cleaning import (
     get_project_root,
     find_raw_file,
+    read_cso_csv,
+    write_cleaned_table,
     map_regions,
-    clean_string_column,
+    clean_string_columns,
     clean_numeric_column,
     ROI_LABEL,
     NI_LABEL,
+    ALL_LABEL,
+    REGION_DTYPE,
 )
 
 #constants
@@ -54,31 +58,28 @@ def clean_population_over_time(raw_path: Path) -> pd.DataFrame:
       - Region (str): Republic of Ireland / Northern Ireland
       - Population (int)
     """
-    df: pd.DataFrame = pd.read_csv(raw_path)
-
-    required_cols = {
+    required_cols = [
         "Statistic Label",
         "Year",
         "Sex",
         "Ireland and Northern Ireland",
         "UNIT",
         "VALUE",
-    }
-    missing = required_cols - set(df.columns)
-    if missing:
-        raise ValueError(
-            f"Missing required columns: {sorted(missing)}\n"
-            f"Columns found: {list(df.columns)}"
-        )
+    ]
+    #only the required columns, parsed by arrow; the projected frame is already a fresh allocation
+    out, _ = read_cso_csv(
+        raw_path, {c: (c,) for c in required_cols}, required=required_cols, what="CPNI01 export"
+    )
 
-    out = df.copy()
+    #strip each label column once (arrow kernel); the filters and region mapping reuse it
+    clean_string_columns(out, ["Statistic Label", "Sex", "Ireland and Northern Ireland", "UNIT"])
 
     if FILTER_STATISTIC_LABEL is not None:
-        out = out[out["Statistic Label"].astype(str).str.strip().eq(FILTER_STATISTIC_LABEL)]
+        out = out[out["Statistic Label"].eq(FILTER_STATISTIC_LABEL)]
     if FILTER_SEX is not None:
-        out = out[out["Sex"].astype(str).str.strip().eq(FILTER_SEX)]
+        out = out[out["Sex"].eq(FILTER_SEX)]
     if FILTER_UNIT is not None:
-        out = out[out["UNIT"].astype(str).str.strip().eq(FILTER_UNIT)]
+        out = out[out["UNIT"].eq(FILTER_UNIT)]
 
     out = out.rename(
         columns={
@@ -87,32 +88,35 @@ def clean_population_over_time(raw_path: Path) -> pd.DataFrame:
         }
     )
 
-    out["Region"] = clean_string_column(out["Region"])
     out = map_regions(out, "Region", "Region")
-    out["Year"] = pd.to_numeric(out["Year"], errors="coerce").astype("Int64")
-    out["Population"] = clean_numeric_column(out["Population"]).astype("Int64")
-
-    out = out.dropna(subset=["Year", "Population"]).copy()
-    out["Year"] = out["Year"].astype(int)
-    out["Population"] = out["Population"].astype(int)
+    #parse once, drop unparsed rows, then cast straight to int64 (no nullable Int64 detour)
+    year = pd.to_numeric(out["Year"], errors="coerce")
+    population = clean_numeric_column(out["Population"])
+    parsed = year.notna() & population.notna()
+    out = out[parsed].assign(Year=year[parsed].astype("int64"), Population=population[parsed].astype("int64"))
 
     #keep only ROI and NI rows
     out = out[out["Region"].isin([ROI_LABEL, NI_LABEL])]
     out = out.sort_values(["Region", "Year"]).reset_index(drop=True)
 
     #ensure 1 row per (Region, Year)
-    if out.duplicated(subset=["Region", "Year"]).any():
-        out = out.drop_duplicates(subset=["Region", "Year"], keep="last")
+    out = out.drop_duplicates(subset=["Region", "Year"], keep="last")
+
+    #only the output columns, with Region in the shared dtype, so the concat copies
+    #three matching blocks instead of NaN-filling the raw columns for All-Island rows
+    out = out[["Year", "Region", "Population"]].astype({"Region": REGION_DTYPE})
 
     #calculate All-Island totals
-    all_island = out.groupby("Year", as_index=False)["Population"].sum()
-    all_island["Region"] = "All-Island"
+    all_island = (
+        out.groupby("Year", as_index=False)["Population"]
+        .sum()
+        .assign(Region=ALL_LABEL)
+        .astype({"Region": REGION_DTYPE})
+    )
 
     #combine with ROI and NI data
     out = pd.concat([out, all_island], ignore_index=True)
-    out = out.sort_values(["Region", "Year"]).reset_index(drop=True)
-
-    cleaned = out[["Year", "Region", "Population"]].reset_index(drop=True)
+    cleaned = out.sort_values(["Region", "Year"]).reset_index(drop=True)
     return cleaned
 
 
@@ -128,7 +132,8 @@ def main() -> None:
     cleaned = clean_population_over_time(raw_path)
 
     out_path = clean_dir / CLEAN_FILENAME
-    cleaned.to_csv(out_path, index=False)
+    #parquet sibling lets the dependent cleaners and the dashboard skip CSV parsing
+    write_cleaned_table(cleaned, out_path)
 
     print(f"Read raw:     {raw_path}")
     print(f"Wrote cleaned:{out_path}")
@@ -12,8 +12,8 @@ def clean_religion():
     df = pd.read_csv(raw_path)
     
     #pivot unit column (number/%) into separate absolute/percentage columns
-    df_num = df[df["UNIT"] == "Number"].copy()
-    df_pct = df[df["UNIT"] == "%"].copy()
+    df_num = df[df["UNIT"] == "Number"]
+    df_pct = df[df["UNIT"] == "%"]
     
     df_num = df_num.rename(columns={"VALUE": "Absolute"})
     df_pct = df_pct.rename(columns={"VALUE": "Percentage"})
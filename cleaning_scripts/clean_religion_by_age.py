@@ -11,11 +11,8 @@ def clean_religion_by_age():
     
     df = pd.read_csv(raw_path)
     
-    #filter to percentage rows only (not number rows)
-    df = df[df["UNIT"] == "%"].copy()
-    
-    #exclude "all ages" aggregate
-    df = df[df["Age Group"] != "All ages"].copy()
+    #percentage rows only (not number rows), excluding the "all ages" aggregate, in one mask
+    df = df[(df["UNIT"] == "%") & (df["Age Group"] != "All ages")]
     
     #rename columns
     df = df.rename(columns={
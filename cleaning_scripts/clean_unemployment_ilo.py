@@ -10,12 +10,14 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 import pandas as pd
 
 from utils.cleaning import (
-    ensure_cols,
+    read_raw_csv,
     latest_timestamped_file,
-    parse_census_year,
+    parse_census_years,
     map_regions,
     clean_string_column,
     clean_numeric_column,
+    skip_if_current,
+    write_cleaned_table,
 )
 
 #constants
@@ -24,6 +26,7 @@ CLEAN_DIR = Path("data/cleaned/economy")
 
 TABLE_PREFIX = "CPNI36"
 OUT_PATH = CLEAN_DIR / "unemployment_rate.csv"
+PARQUET_PATH = OUT_PATH.with_suffix(".parquet")
 
 REQUIRED_COLS: List[str] = [
     "Statistic Label",
@@ -36,11 +39,9 @@ REQUIRED_COLS: List[str] = [
 
 
 def clean_unemployment_ilo(raw_path: Path) -> pd.DataFrame:
-    df = pd.read_csv(raw_path)
-    ensure_cols(df, REQUIRED_COLS)
+    df = read_raw_csv(raw_path, REQUIRED_COLS)
 
     df["Statistic Label"] = clean_string_column(df["Statistic Label"])
-    df["Census Year"] = clean_string_column(df["Census Year"])
     df["Ireland and Northern Ireland"] = clean_string_column(df["Ireland and Northern Ireland"])
     df["Sex"] = clean_string_column(df["Sex"])
     df["UNIT"] = clean_string_column(df["UNIT"])
@@ -65,9 +66,9 @@ def clean_unemployment_ilo(raw_path: Path) -> pd.DataFrame:
     df = map_regions(df, "Ireland and Northern Ireland", "Region")
 
     #derive year int
-    df["Year"] = df["Census Year"].apply(parse_census_year).astype(int)
+    df["Year"] = parse_census_years(df["Census Year"])
 
-    out = df[["Year", "Region", "Sex", "VALUE"]].rename(columns={"VALUE": "Unemployment rate"}).copy()
+    out = df[["Year", "Region", "Sex", "VALUE"]].rename(columns={"VALUE": "Unemployment rate"})
 
     #deduplicate defensively
     out = out.groupby(["Year", "Region", "Sex"], as_index=False)["Unemployment rate"].mean()
@@ -84,10 +85,14 @@ def main() -> None:
     CLEAN_DIR.mkdir(parents=True, exist_ok=True)
 
     raw_path = latest_timestamped_file(RAW_DIR, TABLE_PREFIX)
+
+    if skip_if_current(PARQUET_PATH, raw_path, Path(__file__)):
+        return
+
     cleaned = clean_unemployment_ilo(raw_path)
 
-    cleaned.to_csv(OUT_PATH, index=False)
-    print(f"Wrote {len(cleaned)} rows to {OUT_PATH}")
+    write_cleaned_table(cleaned, OUT_PATH)
+    print(f"Wrote {len(cleaned)} rows to {OUT_PATH} (+ {PARQUET_PATH.name})")
 
 
 if __name__ == "__main__":
@@ -0,0 +1,123 @@
+#runs every cleaning script, independent ones in parallel worker processes
+#usage (from anywhere): python cleaning_scripts/run_all_cleaners.py [clean_<name> ...] [--force]
+#naming cleaners runs just those (still in parallel); other arguments are passed through to each cleaner
+
+from __future__ import annotations
+
+import contextlib
+import io
+import os
+import runpy
+import sys
+import traceback
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from pathlib import Path
+from typing import Final, List, Tuple
+
+SCRIPTS_DIR: Final[Path] = Path(__file__).resolve().parent
+PROJECT_ROOT: Final[Path] = SCRIPTS_DIR.parent
+
+#cleaners that read another cleaner's output (population_over_time.csv)
+UPSTREAM_CLEANER: Final[str] = "clean_population_over_time.py"
+DEPENDENT_CLEANERS: Final[List[str]] = [
+    "clean_dependency_ratio_over_time.py",
+    "clean_median_age_over_time.py",
+]
+
+#boundary preprocessing, only re-run by hand when the raw GeoJSON changes
+EXCLUDED_SCRIPTS: Final[set[str]] = {
+    "clean_ROI_geodata.py",
+    "clean_map_geodata.py",
+}
+
+
+def _warm_imports() -> None:
+    #pay the heavy imports once per worker rather than once per cleaner
+    #root goes on the path here so utils.cleaning imports in the worker
+    if str(PROJECT_ROOT) not in sys.path:
+        sys.path.insert(0, str(PROJECT_ROOT))
+    import pandas  # noqa: F401
+    import pyarrow  # noqa: F401
+    import utils.cleaning  # noqa: F401
+
+
+def _run_cleaner(script: str, args: List[str]) -> Tuple[str, bool, str]:
+    #scripts resolve data/ paths relative to the project root
+    os.chdir(PROJECT_ROOT)
+    sys.argv = [str(SCRIPTS_DIR / script), *args]
+
+    output = io.StringIO()
+    ok = True
+    with contextlib.redirect_stdout(output), contextlib.redirect_stderr(output):
+        try:
+            runpy.run_path(str(SCRIPTS_DIR / script), run_name="__main__")
+        except SystemExit as exc:
+            ok = exc.code in (None, 0)
+        except Exception:
+            ok = False
+            traceback.print_exc()
+    return script, ok, output.getvalue()
+
+
+def _run_all(pool: ProcessPoolExecutor, independent: List[str], dependent: List[str], args: List[str]) -> List[str]:
+    #dependents are submitted as soon as the upstream cleaner succeeds, not after the whole first batch
+    failed = []
+    pending: set[Future] = {pool.submit(_run_cleaner, script, args) for script in independent}
+    if UPSTREAM_CLEANER not in independent:
+        pending |= {pool.submit(_run_cleaner, script, args) for script in dependent}
+    while pending:
+        done, pending = wait(pending, return_when=FIRST_COMPLETED)
+        for future in done:
+            script, ok, output = future.result()
+            print(f"{'OK  ' if ok else 'FAIL'} {script}")
+            if not ok:
+                failed.append(script)
+                print(output)
+            if script != UPSTREAM_CLEANER:
+                continue
+            if ok:
+                pending |= {pool.submit(_run_cleaner, dep, args) for dep in dependent}
+            else:
+                #dependents would weight All-Island with a stale or missing population_over_time
+                for dep in dependent:
+                    print(f"SKIP {dep} (skipped: upstream failed)")
+                    failed.append(dep)
+    return failed
+
+
+def _split_args(argv: List[str]) -> Tuple[set[str], List[str]]:
+    #clean_<name>[.py] arguments select scripts; everything else goes to the cleaners
+    selected = set()
+    passthrough = []
+    for arg in argv:
+        if arg.startswith("clean_"):
+            selected.add(arg if arg.endswith(".py") else f"{arg}.py")
+        else:
+            passthrough.append(arg)
+    return selected, passthrough
+
+
+def main() -> None:
+    selected, args = _split_args(sys.argv[1:])
+    available = {p.name for p in SCRIPTS_DIR.glob("clean_*.py")} - EXCLUDED_SCRIPTS
+    unknown = selected - available
+    if unknown:
+        print(f"Unknown cleaner(s): {', '.join(sorted(unknown))}")
+        sys.exit(2)
+
+    chosen = selected or available
+    independent = sorted(chosen - set(DEPENDENT_CLEANERS))
+    dependent = [s for s in DEPENDENT_CLEANERS if s in chosen]
+
+    workers = min(os.cpu_count() or 1, max(len(independent) + len(dependent), 1))
+    with ProcessPoolExecutor(max_workers=workers, initializer=_warm_imports) as pool:
+        failed = _run_all(pool, independent, dependent, args)
+
+    if failed:
+        print(f"\n{len(failed)} cleaner(s) failed: {', '.join(failed)}")
+        sys.exit(1)
+    print(f"\nAll {len(independent) + len(dependent)} cleaners finished")
+
+
+if __name__ == "__main__":
+    main()
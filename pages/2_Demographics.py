@@ -8,7 +8,7 @@ import plotly.express as px
 import plotly.graph_objects as go
 import streamlit as st
 
-from utils.common import ensure_cols, ALL_REGIONS
+from utils.common import ensure_cols, read_cleaned_table, ALL_REGIONS
 
 pyramid_year = 2022
 
@@ -35,7 +35,7 @@ REGIONS = ALL_REGIONS
 
 @st.cache_data(show_spinner=False)
 def load_population_over_time(path: Path) -> pd.DataFrame:
-    df = pd.read_csv(path)
+    df = read_cleaned_table(path)
     ensure_cols(df, ["Year", "Region", "Population"])
 
     df["Year"] = pd.to_numeric(df["Year"], errors="coerce").astype(int)
@@ -48,7 +48,7 @@ def load_population_over_time(path: Path) -> pd.DataFrame:
 
 @st.cache_data(show_spinner=False)
 def load_population_distribution(path: Path) -> pd.DataFrame:
-    df = pd.read_csv(path)
+    df = read_cleaned_table(path)
     ensure_cols(df, ["Year", "Region", "Sex", "Age band", "Population"])
 
     df["Year"] = pd.to_numeric(df["Year"], errors="coerce").astype(int)
@@ -67,7 +67,7 @@ def load_population_distribution(path: Path) -> pd.DataFrame:
 
 @st.cache_data(show_spinner=False)
 def load_median_age(path: Path) -> pd.DataFrame:
-    df = pd.read_csv(path)
+    df = read_cleaned_table(path)
     ensure_cols(df, ["Year", "Region", "Median age"])
 
     df["Year"] = pd.to_numeric(df["Year"], errors="coerce").astype(int)
@@ -80,7 +80,7 @@ def load_median_age(path: Path) -> pd.DataFrame:
 
 @st.cache_data(show_spinner=False)
 def load_dependency_ratio(path: Path) -> pd.DataFrame:
-    df = pd.read_csv(path)
+    df = read_cleaned_table(path)
     ensure_cols(df, ["Year", "Region", "Dependency ratio"])
 
     df["Year"] = pd.to_numeric(df["Year"], errors="coerce").astype(int)
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import re
 from pathlib import Path
 from typing import List, Tuple
 
@@ -7,7 +8,7 @@ import pandas as pd
 import plotly.express as px
 import streamlit as st
 
-from utils.common import ensure_cols, ROI, NI, REGIONS
+from utils.common import ensure_cols, read_cleaned_table, ROI, NI, REGIONS
 
 
 #page config
@@ -26,12 +27,15 @@ LABOUR_PATH = CLEAN_DIR / "labour_market_snapshot.csv"
 SECTOR_PATH = CLEAN_DIR / "employment_by_sector.csv"
 COMMUTE_PATH = CLEAN_DIR / "commute_mode.csv"
 
+#first run of digits in an age group label, e.g. "15-24 years" -> "15"
+AGE_START_RE = re.compile(r"\d+")
+
 #loaders
 
 
 @st.cache_data(show_spinner=False)
 def load_unemployment(path: Path) -> pd.DataFrame:
-    df = pd.read_csv(path)
+    df = read_cleaned_table(path)
     ensure_cols(df, ["Year", "Region", "Sex", "Unemployment rate"])
 
     df["Year"] = pd.to_numeric(df["Year"], errors="coerce").astype(int)
@@ -45,7 +49,7 @@ def load_unemployment(path: Path) -> pd.DataFrame:
 
 @st.cache_data(show_spinner=False)
 def load_labour_snapshot(path: Path) -> pd.DataFrame:
-    df = pd.read_csv(path)
+    df = read_cleaned_table(path)
     ensure_cols(
         df,
         [
@@ -75,7 +79,7 @@ def load_labour_snapshot(path: Path) -> pd.DataFrame:
 
 @st.cache_data(show_spinner=False)
 def load_sector_employment(path: Path) -> pd.DataFrame:
-    df = pd.read_csv(path)
+    df = read_cleaned_table(path)
     ensure_cols(df, ["Year", "Region", "Sector", "Share", "Persons"])
 
     df["Year"] = pd.to_numeric(df["Year"], errors="coerce").astype(int)
@@ -90,7 +94,7 @@ def load_sector_employment(path: Path) -> pd.DataFrame:
 
 @st.cache_data(show_spinner=False)
 def load_commute_modes(path: Path) -> pd.DataFrame:
-    df = pd.read_csv(path)
+    df = read_cleaned_table(path)
     ensure_cols(df, ["Year", "Region", "Mode", "Share", "Persons"])
 
     df["Year"] = pd.to_numeric(df["Year"], errors="coerce").astype(int)
@@ -386,7 +390,7 @@ st.header("Cross-border commuting")
 CROSS_PATH = CLEAN_DIR / "cross_border_commuters.csv"
 
 if CROSS_PATH.exists():
-    cross = pd.read_csv(CROSS_PATH)
+    cross = read_cleaned_table(CROSS_PATH)
     ensure_cols(cross, ["Year", "Region", "Age group", "Persons"])
 
     cross["Year"] = pd.to_numeric(cross["Year"], errors="coerce").astype(int)
@@ -410,13 +414,8 @@ if CROSS_PATH.exists():
         def _age_key(s: str) -> tuple:
             #extract first number from age group string
             s = str(s).strip()
-            digits = ""
-            for ch in s:
-                if ch.isdigit():
-                    digits += ch
-                elif digits:
-                    break
-            return (int(digits) if digits else 999, s)
+            m = AGE_START_RE.search(s)
+            return (int(m.group()) if m else 999, s)
 
         ages_no_all = sorted(ages_no_all, key=_age_key)
         if all_label in ages:
@@ -6,7 +6,7 @@ import pandas as pd
 import plotly.express as px
 import streamlit as st
 
-from utils.common import ensure_cols, ROI, NI, REGIONS
+from utils.common import ensure_cols, read_cleaned_table, ROI, NI, REGIONS
 
 
 #page config
@@ -89,7 +89,7 @@ simplify_tenure = st.toggle(
 if not TENURE_PATH.exists():
     st.info("Tenure data not yet integrated. Run clean_housing_tenure.py to generate the cleaned CSV.")
 else:
-    tenure_all = pd.read_csv(TENURE_PATH)
+    tenure_all = read_cleaned_table(TENURE_PATH)
     ensure_cols(tenure_all, ["Year", "Region", "Nature", "Percentage", "Absolute"])
 
     tenure_all["Year"] = pd.to_numeric(tenure_all["Year"], errors="coerce").astype(int)
@@ -219,7 +219,7 @@ with left_col:
     if not TYPE_PATH.exists():
         st.info("Housing type data not yet integrated. Run clean_housing_type.py to generate the cleaned CSV.")
     else:
-        ht_all = pd.read_csv(TYPE_PATH)
+        ht_all = read_cleaned_table(TYPE_PATH)
         ensure_cols(ht_all, ["Year", "Region", "Type", "Percentage", "Absolute"])
 
         ht_all["Year"] = pd.to_numeric(ht_all["Year"], errors="coerce").astype(int)
@@ -258,7 +258,7 @@ with left_col:
                 title_suffix = "percent"
 
                 check = ht_y.groupby("Region")["Percentage"].sum().round(1)
-                if not all(check.between(99.0, 101.0)):
+                if not check.between(99.0, 101.0).all():
                     st.caption(f"Note: percentages do not sum to exactly 100 due to rounding: {check.to_dict()}")
 
             fig_type = px.bar(
@@ -292,7 +292,7 @@ with right_col:
     if not OCC_PATH.exists():
         st.info("Housing occupancy data not yet integrated. Run clean_housing_occupancy.py to generate the cleaned CSV.")
     else:
-        occ_all = pd.read_csv(OCC_PATH)
+        occ_all = read_cleaned_table(OCC_PATH)
 
         if "Absolute" in occ_all.columns:
             ensure_cols(occ_all, ["Year", "Region", "Occupancy", "Percentage", "Absolute"])
@@ -337,7 +337,7 @@ with right_col:
                 title_suffix = "percent"
 
                 check = occ_y.groupby("Region")["Percentage"].sum().round(1)
-                if not all(check.between(99.5, 100.5)):
+                if not check.between(99.5, 100.5).all():
                     raise ValueError(f"Occupancy percentages do not sum to 100 by region: {check.to_dict()}")
 
             fig_occ = px.bar(
@@ -370,7 +370,7 @@ st.subheader("Household composition")
 if not HH_COMP_PATH.exists():
     st.info("Household composition data not yet integrated. Run clean_household_composition.py to generate the cleaned CSV.")
 else:
-    comp_all = pd.read_csv(HH_COMP_PATH)
+    comp_all = read_cleaned_table(HH_COMP_PATH)
     ensure_cols(comp_all, ["Year", "Region", "Composition", "Percentage", "Absolute"])
 
     comp_all["Year"] = pd.to_numeric(comp_all["Year"], errors="coerce").astype(int)
@@ -472,7 +472,7 @@ st.subheader("Educational attainment")
 if not EDU_QUAL_PATH.exists():
     st.info("Education qualifications data not yet integrated. Run clean_education_qualifications.py to generate the cleaned CSV.")
 else:
-    edu_all = pd.read_csv(EDU_QUAL_PATH)
+    edu_all = read_cleaned_table(EDU_QUAL_PATH)
     ensure_cols(edu_all, ["Year", "Region", "Sex", "Qualification", "Percentage", "Absolute"])
 
     edu_all["Year"] = pd.to_numeric(edu_all["Year"], errors="coerce").astype(int)
@@ -554,7 +554,7 @@ st.header("Health")
 if not HEALTH_PATH.exists():
     st.info("Health indicators data will be integrated here.")
 else:
-    health_all = pd.read_csv(HEALTH_PATH)
+    health_all = read_cleaned_table(HEALTH_PATH)
     ensure_cols(health_all, ["Year", "Region", "Rating", "Percentage", "Absolute"])
 
     health_all["Year"] = pd.to_numeric(health_all["Year"], errors="coerce").astype(int)
@@ -617,7 +617,7 @@ st.subheader("General health by age")
 if not HEALTH_AGE_PATH.exists():
     st.info("Health by age data not yet integrated. Run clean_general_health_by_age.py to generate the cleaned CSV.")
 else:
-    health_age_all = pd.read_csv(HEALTH_AGE_PATH)
+    health_age_all = read_cleaned_table(HEALTH_AGE_PATH)
     ensure_cols(health_age_all, ["Year", "Region", "Rating", "Age_Bracket", "Percentage"])
 
     health_age_all["Year"] = health_age_all["Year"].astype(str).str.strip()
@@ -6,7 +6,7 @@ import pandas as pd
 import plotly.express as px
 import streamlit as st
 
-from utils.common import ensure_cols, ROI, NI, REGIONS
+from utils.common import ensure_cols, read_cleaned_table, ROI, NI, REGIONS
 
 
 #chart height constants
@@ -244,7 +244,7 @@ st.header("Ethnicity")
 if not ETHNICITY_PATH.exists():
     st.info("Ethnicity data not yet integrated.")
 else:
-    eth_all = pd.read_csv(ETHNICITY_PATH)
+    eth_all = read_cleaned_table(ETHNICITY_PATH)
     ensure_cols(eth_all, ["Year", "Region", "Ethnicity", "Percentage", "Absolute"])
 
     eth_all["Year"] = eth_all["Year"].astype(str).str.strip()
@@ -334,7 +334,7 @@ st.header("Languages")
 if not LANGUAGES_PATH.exists():
     st.info("Languages data not yet integrated.")
 else:
-    lang_all = pd.read_csv(LANGUAGES_PATH)
+    lang_all = read_cleaned_table(LANGUAGES_PATH)
     ensure_cols(lang_all, ["Year", "Region", "Language", "Percentage", "Absolute"])
     
     lang_all["Year"] = lang_all["Year"].astype(int)
@@ -401,7 +401,7 @@ st.header("Migration")
 if not MIGRATION_PATH.exists():
     st.info("Migration data not yet integrated.")
 else:
-    mig_all = pd.read_csv(MIGRATION_PATH)
+    mig_all = read_cleaned_table(MIGRATION_PATH)
     ensure_cols(mig_all, ["Year", "Region", "Country", "Percentage", "Absolute"])
     
     mig_all["Year"] = mig_all["Year"].astype(str).str.strip()
@@ -471,7 +471,7 @@ st.write("Marriage patterns and trends over a 20-year period, showing changes in
 if not MARRIAGE_PATH.exists():
     st.info("Marriage data not yet integrated.")
 else:
-    mar_all = pd.read_csv(MARRIAGE_PATH)
+    mar_all = read_cleaned_table(MARRIAGE_PATH)
     ensure_cols(mar_all, ["Year", "Sex", "Status", "Region", "Percentage", "Absolute"])
     
     mar_all["Year"] = mar_all["Year"].astype(str).str.strip()
@@ -1,19 +1,35 @@
 """Unit tests for utils.cleaning module."""
 
+import os
 import sys
 from pathlib import Path
 
 # Add project root to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
+import numpy as np
 import pytest
 import pandas as pd
 from utils.cleaning import (
     parse_census_year,
+    parse_census_years,
     ensure_cols,
+    check_percentage_totals,
     map_regions,
     clean_string_column,
+    clean_string_columns,
     clean_numeric_column,
+    output_is_current,
+    skip_if_current,
+    latest_timestamped_file,
+    clear_raw_file_cache,
+    write_cleaned_table,
+    weighted_group_mean,
+    pivot_units,
+    read_raw_csv,
+    read_cso_csv,
+    load_population_weights,
+    load_cpni,
     STANDARD_REGION_MAP,
     ROI_LABEL,
     NI_LABEL,
@@ -48,6 +64,146 @@ class TestParseCensusYear:
             parse_census_year("")
 
 
+class TestParseCensusYears:
+    """Tests for parse_census_years function."""
+    
+    def test_parses_column(self):
+        """Test that every row is parsed and the index is kept."""
+        series = pd.Series(["2021/2022", "2011", "2021/2022"], index=[5, 6, 7])
+        result = parse_census_years(series)
+        
+        assert list(result) == [2022, 2011, 2022]
+        assert list(result.index) == [5, 6, 7]
+        assert result.dtype == np.int16
+    
+    def test_invalid_label_raises_error(self):
+        """Test that an unparseable label raises ValueError."""
+        with pytest.raises(ValueError, match="Could not parse Census Year"):
+            parse_census_years(pd.Series(["2022", "invalid"]))
+    
+    def test_error_lists_every_bad_label(self):
+        """Test that all unparseable labels are reported together."""
+        with pytest.raises(ValueError, match=r"\['bad', 'invalid'\]"):
+            parse_census_years(pd.Series(["invalid", "2022", "bad", "invalid"]))
+    
+    def test_missing_value_raises_error(self):
+        """Test that missing labels raise ValueError."""
+        with pytest.raises(ValueError):
+            parse_census_years(pd.Series(["2022", None]))
+
+
+class TestLatestTimestampedFile:
+    """Tests for latest_timestamped_file function."""
+    
+    def test_picks_latest_timestamp(self, tmp_path):
+        """Test that the lexically latest timestamp for the prefix is chosen."""
+        for name in ["CPNI01.20250101T000000.csv", "CPNI01.20260101T000000.csv", "CPNI02.20270101T000000.csv"]:
+            (tmp_path / name).write_text("a\n1\n")
+        
+        assert latest_timestamped_file(tmp_path, "CPNI01") == tmp_path / "CPNI01.20260101T000000.csv"
+    
+    def test_no_match_raises_error(self, tmp_path):
+        """Test that a missing prefix raises FileNotFoundError."""
+        with pytest.raises(FileNotFoundError):
+            latest_timestamped_file(tmp_path, "CPNI99")
+    
+    def test_listing_is_cached_until_cleared(self, tmp_path):
+        """Test that a directory is scanned once until the cache is cleared."""
+        (tmp_path / "CPNI01.20250101T000000.csv").write_text("a\n1\n")
+        assert latest_timestamped_file(tmp_path, "CPNI01").name == "CPNI01.20250101T000000.csv"
+        
+        (tmp_path / "CPNI01.20260101T000000.csv").write_text("a\n1\n")
+        assert latest_timestamped_file(tmp_path, "CPNI01").name == "CPNI01.20250101T000000.csv"
+        
+        clear_raw_file_cache()
+        assert latest_timestamped_file(tmp_path, "CPNI01").name == "CPNI01.20260101T000000.csv"
+
+
+class TestOutputIsCurrent:
+    """Tests for output_is_current function."""
+    
+    def test_missing_output(self, tmp_path):
+        """Test that a missing output is never current."""
+        raw = tmp_path / "raw.csv"
+        raw.write_text("a\n1\n")
+        assert not output_is_current(tmp_path / "out.parquet", raw)
+    
+    def test_newer_output_is_current(self, tmp_path):
+        """Test that an output newer than its inputs is current."""
+        raw = tmp_path / "raw.csv"
+        out = tmp_path / "out.parquet"
+        raw.write_text("a\n1\n")
+        out.write_text("")
+        os.utime(raw, (1_000, 1_000))
+        os.utime(out, (2_000, 2_000))
+        assert output_is_current(out, raw)
+    
+    def test_older_output_is_stale(self, tmp_path):
+        """Test that an input modified after the output makes it stale."""
+        raw = tmp_path / "raw.csv"
+        out = tmp_path / "out.parquet"
+        raw.write_text("a\n1\n")
+        out.write_text("")
+        os.utime(out, (1_000, 1_000))
+        os.utime(raw, (2_000, 2_000))
+        assert not output_is_current(out, raw)
+
+
+class TestSkipIfCurrent:
+    """Tests for skip_if_current function."""
+    
+    @staticmethod
+    def _files(tmp_path, out_time):
+        raw = tmp_path / "raw.csv"
+        script = tmp_path / "clean_x.py"
+        out = tmp_path / "out.parquet"
+        for path in (raw, script, out):
+            path.write_text("")
+        os.utime(raw, (1_000, 1_000))
+        os.utime(script, (1_000, 1_000))
+        os.utime(out, (out_time, out_time))
+        return out, raw, script
+    
+    def test_current_output_is_skipped(self, tmp_path, monkeypatch):
+        """Test that an output newer than every input is skipped."""
+        monkeypatch.setattr(sys, "argv", ["clean_x.py"])
+        out, raw, script = self._files(tmp_path, 4_000_000_000)
+        assert skip_if_current(out, raw, script)
+    
+    def test_force_rebuilds(self, tmp_path, monkeypatch):
+        """Test that --force rebuilds a current output."""
+        monkeypatch.setattr(sys, "argv", ["clean_x.py", "--force"])
+        out, raw, script = self._files(tmp_path, 4_000_000_000)
+        assert not skip_if_current(out, raw, script)
+    
+    def test_utils_edit_invalidates(self, tmp_path, monkeypatch):
+        """Test that an output older than utils/cleaning.py is rebuilt."""
+        monkeypatch.setattr(sys, "argv", ["clean_x.py"])
+        out, raw, script = self._files(tmp_path, 2_000)
+        assert not skip_if_current(out, raw, script)
+
+
+class TestWriteCleanedTable:
+    """Tests for write_cleaned_table function."""
+    
+    def test_writes_csv_and_parquet(self, tmp_path):
+        """Test that both copies are written with the same contents."""
+        df = pd.DataFrame({"Year": [2022, 2021], "Region": ["ROI", "NI"]})
+        out = tmp_path / "table.csv"
+        parquet_path = write_cleaned_table(df, out)
+        
+        assert parquet_path == tmp_path / "table.parquet"
+        assert pd.read_csv(out).equals(df)
+        assert list(pd.read_parquet(parquet_path)["Region"]) == ["ROI", "NI"]
+    
+    def test_parquet_not_older_than_csv(self, tmp_path):
+        """Test that the Parquet copy is never older than the CSV."""
+        out = tmp_path / "table.csv"
+        parquet_path = write_cleaned_table(pd.DataFrame({"A": [1]}), out)
+        
+        assert parquet_path.stat().st_mtime >= out.stat().st_mtime
+
+
 class TestEnsureCols:
     """Tests for ensure_cols function."""
     
@@ -90,12 +246,27 @@ class TestMapRegions:
         
         assert list(result["MappedLocation"]) == ["Alpha", "Beta"]
     
+    def test_result_is_sorted_categorical(self):
+        """Test that regions come back as a Categorical with sorted categories."""
+        df = pd.DataFrame({"Country": ["Northern Ireland", "Ireland", "Northern Ireland"]})
+        result = map_regions(df, "Country", "Region")
+        
+        assert isinstance(result["Region"].dtype, pd.CategoricalDtype)
+        assert list(result["Region"].cat.categories) == sorted([ROI_LABEL, NI_LABEL])
+        assert list(result["Region"]) == [NI_LABEL, ROI_LABEL, NI_LABEL]
+    
     def test_unknown_region_raises_error(self):
         """Test that unmapped regions raise ValueError."""
         df = pd.DataFrame({"Country": ["Unknown Country"], "Value": [100]})
         with pytest.raises(ValueError, match="Unknown region labels encountered"):
             map_regions(df, "Country", "Region")
     
+    def test_missing_region_raises_error(self):
+        """Test that missing region labels raise ValueError."""
+        df = pd.DataFrame({"Country": ["Ireland", None], "Value": [100, 50]})
+        with pytest.raises(ValueError, match="Unknown region labels encountered"):
+            map_regions(df, "Country", "Region")
+    
     def test_original_df_unchanged(self):
         """Test that original DataFrame is not modified."""
         df = pd.DataFrame({"Country": ["Ireland"], "Value": [100]})
@@ -105,6 +276,129 @@ class TestMapRegions:
         assert list(df.columns) == original_cols  # Original unchanged
 
 
+class TestCheckPercentageTotals:
+    """Tests for check_percentage_totals function."""
+    
+    def test_accepts_groups_summing_to_100(self):
+        """Test that totals of ~100 per group pass."""
+        df = pd.DataFrame({
+            "Region": ["A", "A", "B", "B"],
+            "Year": [2022, 2022, 2022, 2022],
+            "Percentage": [40.0, 60.05, 99.5, 0.5],
+        })
+        check_percentage_totals(df, ["Region", "Year"], "Test")
+    
+    def test_raises_on_bad_group(self):
+        """Test that a group missing part of its distribution raises."""
+        df = pd.DataFrame({
+            "Region": ["A", "A", "B"],
+            "Year": [2022, 2022, 2022],
+            "Percentage": [40.0, 60.0, 50.0],
+        })
+        with pytest.raises(ValueError, match="Test percentages do not sum to ~100 by region/year"):
+            check_percentage_totals(df, ["Region", "Year"], "Test")
+    
+    def test_keys_are_combined(self):
+        """Test that groups are formed from every key, not each key separately."""
+        df = pd.DataFrame({
+            "Region": ["A", "A", "A", "A"],
+            "Year": [2016, 2016, 2022, 2022],
+            "Percentage": [30.0, 70.0, 20.0, 80.0],
+        })
+        check_percentage_totals(df, ["Region", "Year"], "Test")
+        with pytest.raises(ValueError):
+            check_percentage_totals(df, ["Region"], "Test")
+    
+    def test_missing_percentage_counts_as_zero(self):
+        """Test that a NaN row is skipped rather than making its group's total NaN."""
+        df = pd.DataFrame({
+            "Region": ["A", "A", "A"],
+            "Year": [2022, 2022, 2022],
+            "Percentage": [40.0, 60.0, np.nan],
+        })
+        check_percentage_totals(df, ["Region", "Year"], "Test")
+    
+    def test_expected_total_in_message(self):
+        """Test that the error message uses the given target wording."""
+        df = pd.DataFrame({"Region": ["A"], "Percentage": [50.0]})
+        with pytest.raises(ValueError, match="Test percentages do not sum to 100 by region"):
+            check_percentage_totals(df, ["Region"], "Test", expected="100")
+
+
+class TestWeightedGroupMean:
+    """Tests for weighted_group_mean function."""
+    
+    def test_weighted_mean_per_group(self):
+        """Test weighted means and total weights per group."""
+        codes = np.array([0, 0, 1])
+        values = np.array([10.0, 20.0, 5.0])
+        weights = np.array([3.0, 1.0, 2.0])
+        means, totals = weighted_group_mean(codes, values, weights, 2)
+        
+        assert list(means) == [12.5, 5.0]
+        assert list(totals) == [4.0, 2.0]
+    
+    def test_nan_weight_propagates(self):
+        """Test that a missing weight makes its group's mean NaN."""
+        means, _ = weighted_group_mean(np.array([0, 0]), np.array([1.0, 2.0]), np.array([1.0, np.nan]), 1)
+        
+        assert np.isnan(means[0])
+
+
+class TestPivotUnits:
+    """Tests for pivot_units function."""
+    
+    def test_pivots_percentage_and_absolute(self):
+        """Test that %/Number rows become sorted Percentage/Absolute columns."""
+        df = pd.DataFrame({
+            "Year": [2022, 2022, 2022, 2022],
+            "Region": ["B", "B", "A", "A"],
+            "UNIT": ["%", "Number", "%", "Number"],
+            "VALUE": [40.0, 4.4, 60.0, 6.0],
+        })
+        out = pivot_units(df, ["Year", "Region"])
+        
+        assert list(out["Region"]) == ["A", "B"]
+        assert list(out["Percentage"]) == [60.0, 40.0]
+        assert list(out["Absolute"]) == [6, 4]
+    
+    def test_unique_keys_reshape_without_aggregation(self):
+        """Test that aggfunc=None gives the same sorted result as aggregating."""
+        df = pd.DataFrame({
+            "Year": [2022, 2022, 2022, 2022],
+            "Region": ["B", "B", "A", "A"],
+            "UNIT": ["%", "Number", "%", "Number"],
+            "VALUE": [40.0, 4.4, 60.0, 6.0],
+        })
+        pd.testing.assert_frame_equal(
+            pivot_units(df, ["Year", "Region"], aggfunc=None),
+            pivot_units(df, ["Year", "Region"], aggfunc="first"),
+        )
+    
+    def test_duplicate_keys_without_aggfunc_raise_error(self):
+        """Test that aggfunc=None rejects repeated key/unit rows."""
+        df = pd.DataFrame({
+            "Year": [2022, 2022, 2022],
+            "Region": ["A", "A", "A"],
+            "UNIT": ["%", "%", "Number"],
+            "VALUE": [60.0, 61.0, 6.0],
+        })
+        with pytest.raises(ValueError, match="Duplicate"):
+            pivot_units(df, ["Year", "Region"], aggfunc=None)
+    
+    def test_unknown_unit_raises_error(self):
+        """Test that units other than % and Number are rejected."""
+        df = pd.DataFrame({"Year": [2022], "Region": ["A"], "UNIT": ["Rate"], "VALUE": [1.0]})
+        with pytest.raises(ValueError, match="Unexpected UNIT values"):
+            pivot_units(df, ["Year", "Region"])
+    
+    def test_missing_unit_raises_error(self):
+        """Test that a table with only one unit is rejected."""
+        df = pd.DataFrame({"Year": [2022], "Region": ["A"], "UNIT": ["%"], "VALUE": [100.0]})
+        with pytest.raises(ValueError, match="Expected both Percentage and Absolute"):
+            pivot_units(df, ["Year", "Region"])
+
+
 class TestCleanStringColumn:
     """Tests for clean_string_column function."""
     
@@ -129,6 +423,34 @@ class TestCleanStringColumn:
         
         assert result[0] in ["None", "nan", "<NA>"]  # Depends on pandas version
         assert result[1] == "text"
+    
+    def test_repeated_labels_keep_index(self):
+        """Test that a low-cardinality column is cleaned per row and keeps its index."""
+        series = pd.Series([" Ireland ", "Northern Ireland "] * 20, index=range(100, 140))
+        result = clean_string_column(series)
+        
+        assert list(result) == ["Ireland", "Northern Ireland"] * 20
+        assert list(result.index) == list(range(100, 140))
+
+
+class TestCleanStringColumns:
+    """Tests for clean_string_columns function."""
+    
+    def test_strips_selected_columns(self):
+        """Test that every listed column is stripped."""
+        df = pd.DataFrame({"A": [" x ", "y  "], "B": ["  z", "w"], "C": [" keep ", "me"]})
+        clean_string_columns(df, ["A", "B"])
+        
+        assert list(df["A"]) == ["x", "y"]
+        assert list(df["B"]) == ["z", "w"]
+        assert list(df["C"]) == [" keep ", "me"]  # Untouched
+    
+    def test_converts_numbers_to_strings(self):
+        """Test that numeric values are converted to strings."""
+        df = pd.DataFrame({"Year": [2022, 2016]})
+        clean_string_columns(df, ["Year"])
+        
+        assert list(df["Year"]) == ["2022", "2016"]
 
 
 class TestCleanNumericColumn:
@@ -151,6 +473,14 @@ class TestCleanNumericColumn:
         assert pd.isna(result[2])
         assert result[3] == 200.0
     
+    def test_repeated_values_parsed_per_row(self):
+        """Test that a column of repeated strings parses to the same values row by row."""
+        series = pd.Series(["100", "-", "200.5"] * 20, index=range(50, 110))
+        result = clean_numeric_column(series)
+        
+        expected = pd.to_numeric(series, errors="coerce")
+        pd.testing.assert_series_equal(result, expected)
+    
     def test_drop_na_option(self):
         """Test that drop_na removes NaN values."""
         series = pd.Series(["100", "invalid", "200"])
@@ -165,6 +495,122 @@ class TestCleanNumericColumn:
         result = clean_numeric_column(series)
         
         assert list(result) == [100.0, 200.5, 300.0]
+    
+    def test_dtype_option(self):
+        """Test that dtype casts the converted values."""
+        series = pd.Series(["1430049", "invalid"])
+        result = clean_numeric_column(series, dtype="float32")
+        
+        assert result.dtype == "float32"
+        assert result.iloc[0] == 1430049
+
+
+class TestReadRawCsv:
+    """Tests for read_raw_csv function."""
+    
+    def test_reads_only_requested_columns(self, tmp_path):
+        """Test that only the requested columns are read."""
+        raw = tmp_path / "raw.csv"
+        raw.write_text("UNIT,VALUE,Extra\nNumber,1,x\n")
+        df = read_raw_csv(raw, ["UNIT", "VALUE"])
+        assert list(df.columns) == ["UNIT", "VALUE"]
+    
+    def test_missing_column_raises_error(self, tmp_path):
+        """Test that a missing column raises ValueError, not ArrowKeyError."""
+        raw = tmp_path / "raw.csv"
+        raw.write_text("UNIT,VALUE\nNumber,1\n")
+        with pytest.raises(ValueError, match="Sex"):
+            read_raw_csv(raw, ["UNIT", "Sex"])
+
+
+class TestReadCsoCsv:
+    """Tests for read_cso_csv function."""
+    
+    ALIASES = {
+        "year": ("year", "census year"),
+        "value": ("value", "values"),
+        "sex": ("sex",),
+    }
+    
+    def test_resolves_aliases_and_projects(self, tmp_path):
+        """Test that headers resolve case-insensitively and only they are read."""
+        raw = tmp_path / "CPNI02.csv"
+        raw.write_text(" Census Year ,Extra,VALUE\n2022,x,5\n")
+        df, cols = read_cso_csv(raw, self.ALIASES, required=["year", "value"])
+        
+        assert cols == {"year": " Census Year ", "value": "VALUE", "sex": None}
+        assert list(df.columns) == [" Census Year ", "VALUE"]
+        assert list(df["VALUE"]) == [5]
+    
+    def test_missing_required_raises_error(self, tmp_path):
+        """Test that an unresolved required column raises ValueError."""
+        raw = tmp_path / "CPNI02.csv"
+        raw.write_text("Year,VALUE\n2022,5\n")
+        with pytest.raises(ValueError, match="sex"):
+            read_cso_csv(raw, self.ALIASES, required=["year", "sex"], what="CPNI02 export")
+
+
+class TestLoadPopulationWeights:
+    """Tests for load_population_weights function."""
+    
+    def test_filters_and_sums_regions(self, tmp_path):
+        """Test that only ROI/NI rows are kept and repeated years are summed."""
+        path = tmp_path / "population_over_time.csv"
+        path.write_text(
+            "Year,Region,Population\n"
+            f"2022, {ROI_LABEL} ,100\n"
+            f"2022,{ROI_LABEL},5\n"
+            f"2022,{NI_LABEL},50\n"
+            "2022,All-Island,155\n"
+            f"x,{NI_LABEL},1\n"
+        )
+        pop = load_population_weights(path).sort_values("Region").reset_index(drop=True)
+        
+        assert list(pop["Region"]) == [NI_LABEL, ROI_LABEL]
+        assert list(pop["Population"]) == [50, 105]
+        assert pop["Year"].dtype == "int64"
+    
+    def test_missing_file_raises_error(self, tmp_path):
+        """Test that a missing cleaned file raises FileNotFoundError."""
+        with pytest.raises(FileNotFoundError):
+            load_population_weights(tmp_path / "population_over_time.csv")
+
+
+class TestLoadCpni:
+    """Tests for load_cpni function."""
+    
+    COLS = ["Statistic Label", "Census Year", "Ireland and Northern Ireland", "UNIT", "VALUE"]
+    
+    def _write_raw(self, tmp_path):
+        raw = tmp_path / "CPNI01.csv"
+        raw.write_text(
+            "Statistic Label,Census Year,Ireland and Northern Ireland,UNIT,VALUE,Extra\n"
+            "Persons in employment, 2021/2022 ,Ireland, Number ,100,x\n"
+            "Persons in employment,2021/2022,Northern Ireland,Number,,x\n"
+            "Persons unemployed,2021/2022,Northern Ireland,Number,50,x\n"
+        )
+        return raw
+    
+    def test_prologue(self, tmp_path):
+        """Test filtering, stripping, VALUE coercion, region mapping and year parsing."""
+        df = load_cpni(self._write_raw(tmp_path), self.COLS, ["Census Year", "UNIT"],
+                       statistic_contains="in employment")
+        
+        assert "Extra" not in df.columns
+        assert list(df["Region"]) == [ROI_LABEL]
+        assert list(df["Year"]) == [2022]
+        assert list(df["UNIT"]) == ["Number"]
+        assert list(df["VALUE"]) == [100.0]
+    
+    def test_empty_filter_raises_error(self, tmp_path):
+        """Test that a statistic filter matching nothing raises ValueError."""
+        with pytest.raises(ValueError, match="no rows remain"):
+            load_cpni(self._write_raw(tmp_path), self.COLS, ["UNIT"], statistic_contains="missing")
+    
+    def test_missing_column_raises_error(self, tmp_path):
+        """Test that a required column absent from the header raises ValueError."""
+        with pytest.raises(ValueError, match="Sex"):
+            load_cpni(self._write_raw(tmp_path), [*self.COLS, "Sex"], ["UNIT"])
 
 
 if __name__ == "__main__":
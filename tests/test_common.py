@@ -1,5 +1,6 @@
 """Unit tests for utils.common module."""
 
+import os
 import sys
 from pathlib import Path
 
@@ -13,11 +14,13 @@ from utils.common import (
     clean_region_column,
     clean_year_column,
     clean_numeric_column,
+    read_cleaned_table,
     ROI,
     NI,
     ALL,
     REGIONS,
     ALL_REGIONS,
+    NATIONS,
 )
 
 
@@ -42,6 +45,12 @@ class TestConstants:
         assert ROI in ALL_REGIONS
         assert NI in ALL_REGIONS
         assert ALL in ALL_REGIONS
+    
+    def test_nations_all_island_gdp(self):
+        """Test that All-Island GDP (USD) is the sum of ROI and NI."""
+        assert set(NATIONS) == {"ROI", "NI", "ALL"}
+        total = NATIONS["ROI"]["gdp_usd_b"] + NATIONS["NI"]["gdp_usd_b"]
+        assert NATIONS["ALL"]["gdp_usd_b"] == pytest.approx(total)
 
 
 class TestEnsureCols:
@@ -69,6 +78,37 @@ class TestEnsureCols:
         ensure_cols(df, ["Year", "Region"])  # Should not raise
 
 
+class TestReadCleanedTable:
+    """Tests for read_cleaned_table function."""
+    
+    def test_reads_csv_without_parquet(self, tmp_path):
+        """Test that the CSV is used when no Parquet sibling exists."""
+        path = tmp_path / "table.csv"
+        pd.DataFrame({"Year": [2022], "Value": [1.5]}).to_csv(path, index=False)
+        result = read_cleaned_table(path)
+        
+        assert list(result["Year"]) == [2022]
+        assert list(result["Value"]) == [1.5]
+    
+    def test_prefers_up_to_date_parquet(self, tmp_path):
+        """Test that a Parquet sibling at least as new as the CSV is preferred."""
+        path = tmp_path / "table.csv"
+        pd.DataFrame({"Source": ["csv"]}).to_csv(path, index=False)
+        pd.DataFrame({"Source": ["parquet"]}).to_parquet(path.with_suffix(".parquet"))
+        os.utime(path, (1_000, 1_000))
+        
+        assert list(read_cleaned_table(path)["Source"]) == ["parquet"]
+    
+    def test_ignores_stale_parquet(self, tmp_path):
+        """Test that a Parquet sibling older than the CSV is ignored."""
+        path = tmp_path / "table.csv"
+        pd.DataFrame({"Source": ["csv"]}).to_csv(path, index=False)
+        pd.DataFrame({"Source": ["parquet"]}).to_parquet(path.with_suffix(".parquet"))
+        os.utime(path.with_suffix(".parquet"), (1_000, 1_000))
+        
+        assert list(read_cleaned_table(path)["Source"]) == ["csv"]
+
+
 class TestCleanRegionColumn:
     """Tests for clean_region_column function."""
     
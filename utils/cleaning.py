@@ -2,28 +2,55 @@
 
 from __future__ import annotations
 
+import os
+import re
+import sys
+from functools import lru_cache
 from pathlib import Path
 from typing import Iterable, Final
 
+import numpy as np
 import pandas as pd
 
+#pandas 3 always copies on write; on pandas 2 opt in so filtered frames share data
+#until written, which is what lets the cleaners skip defensive .copy() calls
+if pd.__version__.startswith("2."):
+    pd.set_option("mode.copy_on_write", True)
+
 
 #constants
 ROI_LABEL: Final[str] = "Republic of Ireland"
 NI_LABEL: Final[str] = "Northern Ireland"
 ALL_LABEL: Final[str] = "All-Island"
 
+#sorted categories, so grouping/sorting on the codes matches sorting the strings;
+#giving ROI/NI and All-Island rows this one dtype keeps pd.concat on the categorical path
+REGION_DTYPE: Final[pd.CategoricalDtype] = pd.CategoricalDtype(sorted([ROI_LABEL, NI_LABEL, ALL_LABEL]))
+
 STANDARD_REGION_MAP: Final[dict[str, str]] = {
     "Ireland": ROI_LABEL,
     "Northern Ireland": NI_LABEL,
 }
 
+#CPNI unit labels -> cleaned value columns
+UNIT_COLUMN_MAP: Final[dict[str, str]] = {
+    "%": "Percentage",
+    "Number": "Absolute",
+}
+
+#clean distinct values once and broadcast when a column has at most 1 unique per this many rows
+_REPEAT_FACTOR: Final[int] = 10
+
 
 #project root detection
+@lru_cache(maxsize=1)
 def get_project_root() -> Path:
     """Find the project root by searching upward for a directory that contains
     both 'pages' and 'data'. This works no matter where you run the script from.
     
+    The upward search runs once per process; later calls (e.g. every cleaner
+    a run_all_cleaners worker executes) reuse the result.
+    
     Returns:
         Path: Project root directory
     """
@@ -35,6 +62,30 @@ def get_project_root() -> Path:
 
 
 #file discovery
+@lru_cache(maxsize=None)
+def _list_csv_files(raw_dir: str) -> tuple[tuple[str, float], ...]:
+    #one scandir per directory per process: a runner importing several cleaners that
+    #share a raw folder reuses the listing (call clear_raw_file_cache() if files change mid-run)
+    if not os.path.isdir(raw_dir):
+        return ()
+    with os.scandir(raw_dir) as entries:
+        return tuple(
+            (entry.name, entry.stat().st_mtime)
+            for entry in entries
+            if entry.name.endswith(".csv") and entry.is_file()
+        )
+
+
+def clear_raw_file_cache() -> None:
+    """Forget cached raw-directory listings so newly added files are seen.
+    
+    find_raw_file and latest_timestamped_file reuse one directory scan per
+    process; call this after adding or replacing raw files in a long-lived
+    process (e.g. a run_all_cleaners worker or a notebook).
+    """
+    _list_csv_files.cache_clear()
+
+
 def find_raw_file(raw_dir: Path, prefix: str, force_filename: str | None = None) -> Path:
     """Pick the raw file to clean.
     
@@ -55,15 +106,15 @@ def find_raw_file(raw_dir: Path, prefix: str, force_filename: str | None = None)
             raise FileNotFoundError(f"Forced raw file not found: {forced}")
         return forced
 
-    matches = list(raw_dir.glob(f"{prefix}*.csv"))
+    matches = [(name, mtime) for name, mtime in _list_csv_files(str(raw_dir)) if name.startswith(prefix)]
     if not matches:
         raise FileNotFoundError(
             f"No raw file matching '{prefix}*.csv' found in {raw_dir}.\n"
             f"Put the downloaded CSV in {raw_dir}/ (any filename starting with '{prefix}' is fine)."
         )
 
-    newest = max(matches, key=lambda p: p.stat().st_mtime)
-    return newest
+    newest, _ = max(matches, key=lambda m: m[1])
+    return raw_dir / newest
 
 
 def latest_timestamped_file(raw_dir: Path, prefix: str) -> Path:
@@ -79,10 +130,69 @@ def latest_timestamped_file(raw_dir: Path, prefix: str) -> Path:
     Raises:
         FileNotFoundError: If no matching files found
     """
-    candidates = sorted(raw_dir.glob(f"{prefix}*.csv"))
-    if not candidates:
+    #timestamps sort lexically, so a single max pass is enough
+    latest = max((name for name, _ in _list_csv_files(str(raw_dir)) if name.startswith(prefix)), default=None)
+    if latest is None:
         raise FileNotFoundError(f"No matching files found in {raw_dir} for pattern {prefix}*.csv")
-    return candidates[-1]
+    return raw_dir / latest
+
+
+def output_is_current(out_path: Path, *inputs: Path) -> bool:
+    """Check whether a cleaned output is newer than every input it was built from.
+    
+    Args:
+        out_path: Cleaned output file
+        inputs: Raw (or upstream cleaned) files the output depends on
+        
+    Returns:
+        bool: True if out_path exists and is at least as new as all inputs
+    """
+    if not out_path.exists():
+        return False
+    out_mtime = out_path.stat().st_mtime
+    return all(p.stat().st_mtime <= out_mtime for p in inputs)
+
+
+def skip_if_current(out_path: Path, raw_path: Path, script: Path) -> bool:
+    """Check whether a cleaner can skip rebuilding an up-to-date output.
+    
+    The output counts as current when it is at least as new as the raw file,
+    the cleaner script and this module, since the shared helpers here hold
+    much of the cleaning logic. Passing --force on the command line always
+    rebuilds.
+    
+    Args:
+        out_path: Cleaned output file
+        raw_path: Raw file the output is built from
+        script: The cleaner script (its __file__)
+        
+    Returns:
+        bool: True (after printing a note) if the cleaner should skip
+    """
+    if "--force" in sys.argv or not output_is_current(out_path, raw_path, Path(script), Path(__file__)):
+        return False
+    print(f"{out_path} is up to date with {raw_path.name}; skipping")
+    return True
+
+
+def write_cleaned_table(df: pd.DataFrame, out_path: Path) -> Path:
+    """Write a cleaned table as CSV plus a zstd-compressed Parquet sibling.
+    
+    The CSV stays the human-readable copy; the pages load the Parquet file
+    (via utils.common.read_cleaned_table), which is columnar and typed so it
+    skips CSV parsing. Parquet is written second so it is never older.
+    
+    Args:
+        df: Cleaned DataFrame
+        out_path: Destination CSV path
+        
+    Returns:
+        Path: The Parquet path written alongside the CSV
+    """
+    parquet_path = out_path.with_suffix(".parquet")
+    df.to_csv(out_path, index=False)
+    df.to_parquet(parquet_path, index=False, compression="zstd")
+    return parquet_path
 
 
 #validation
@@ -102,7 +212,49 @@ def ensure_cols(df: pd.DataFrame, cols: Iterable[str]) -> None:
         raise ValueError(f"Missing expected columns: {missing}. Got: {list(df.columns)}")
 
 
+def check_percentage_totals(df: pd.DataFrame, keys: list[str], what: str,
+                            low: float = 99.0, high: float = 101.0,
+                            col: str = "Percentage", expected: str = "~100") -> None:
+    """Validate that percentages sum to ~100 within each group.
+    
+    Group keys are factorized and summed with np.bincount, so the check is a
+    single compiled pass with no groupby/MultiIndex construction.
+    
+    Args:
+        df: Cleaned DataFrame
+        keys: Columns identifying a group (e.g. ["Region", "Year"])
+        what: Table description used in the error message
+        low: Smallest acceptable total (after rounding to 1 dp)
+        high: Largest acceptable total (after rounding to 1 dp)
+        col: Column holding the percentages; missing values count as 0
+        expected: Target total as worded in the error message
+        
+    Raises:
+        ValueError: If any group's total falls outside [low, high]
+    """
+    codes, _ = pd.factorize(df[keys[0]], use_na_sentinel=False)
+    if len(keys) > 1:
+        #mixed-radix combine of the per-key codes, then compact to dense group ids
+        for key in keys[1:]:
+            key_codes, uniques = pd.factorize(df[key], use_na_sentinel=False)
+            codes = codes * len(uniques) + key_codes
+        codes, _ = pd.factorize(codes)
+
+    #NaN would poison its whole group's total; groupby().sum() skips it, so count it as 0
+    values = np.nan_to_num(df[col].to_numpy(dtype="float64", na_value=np.nan))
+    totals = np.bincount(codes, weights=values).round(1)
+    if not ((totals >= low) & (totals <= high)).all():
+        check = df.groupby(keys)[col].sum().round(1)
+        raise ValueError(
+            f"{what} percentages do not sum to {expected} by {'/'.join(k.lower() for k in keys)}: {check.to_dict()}"
+        )
+
+
 #year parsing
+#a lone 4-digit year, or the last one of a slash-separated pair ("2021/2022" -> 2022)
+_CENSUS_YEAR_RE: Final[re.Pattern[str]] = re.compile(r"(?:^|/)\D*(\d{4})\D*$")
+
+
 def parse_census_year(census_year: str) -> int:
     """Parse census year from joint publication format.
     
@@ -120,21 +272,38 @@ def parse_census_year(census_year: str) -> int:
     Raises:
         ValueError: If no 4-digit year can be extracted
     """
-    s = str(census_year).strip()
+    match = _CENSUS_YEAR_RE.search(str(census_year).strip())
+    if match:
+        return int(match.group(1))
     
-    #handle slash-separated years (e.g., "2021/2022")
-    if "/" in s:
-        tail = s.split("/")[-1]
-        digits = "".join(ch for ch in tail if ch.isdigit())
-        if len(digits) == 4:
-            return int(digits)
+    raise ValueError(f"Could not parse Census Year '{census_year}' into a 4-digit year.")
+
+
+def parse_census_years(series: pd.Series) -> pd.Series:
+    """Parse a whole column of census year labels.
     
-    #extract any 4-digit sequence
-    digits = "".join(ch for ch in s if ch.isdigit())
-    if len(digits) == 4:
-        return int(digits)
+    The distinct labels are parsed in one vectorized `str.extract` with the
+    same pattern as `parse_census_year`, and the years are broadcast back
+    through the factorized codes, so there is no per-row Python call.
     
-    raise ValueError(f"Could not parse Census Year '{census_year}' into a 4-digit year.")
+    Args:
+        series: Column of census year strings
+        
+    Returns:
+        pd.Series: int16 years (census years fit comfortably), aligned to the input index
+        
+    Raises:
+        ValueError: If a label contains no 4-digit year (or is missing)
+    """
+    codes, labels = pd.factorize(series)
+    if (codes < 0).any():
+        raise ValueError("Could not parse Census Year: column contains missing values.")
+    years = pd.Series(labels, dtype="string").str.strip().str.extract(_CENSUS_YEAR_RE, expand=False)
+    if years.isna().any():
+        bad = sorted(str(label) for label in np.asarray(labels)[years.isna().to_numpy()])
+        raise ValueError(f"Could not parse Census Year into a 4-digit year: {bad}")
+    years = years.astype("int16").to_numpy()
+    return pd.Series(years[codes], index=series.index, name=series.name)
 
 #region mapping
 def map_regions(df: pd.DataFrame, source_col: str, target_col: str = "Region", 
@@ -148,21 +317,109 @@ def map_regions(df: pd.DataFrame, source_col: str, target_col: str = "Region",
         region_map: Mapping from raw to standard names (default: STANDARD_REGION_MAP)
         
     Returns:
-        pd.DataFrame: DataFrame with mapped regions
+        pd.DataFrame: DataFrame with mapped regions as a Categorical whose
+        categories are the standard names in sorted order (so sorting and
+        grouping on the codes matches sorting the strings)
         
     Raises:
         ValueError: If any regions cannot be mapped
     """
-    df = df.copy()
-    df[target_col] = df[source_col].map(region_map)
+    #map the handful of distinct labels, then build the Categorical straight from the codes
+    codes, labels = pd.factorize(df[source_col], use_na_sentinel=False)
+    mapped = labels.map(region_map)
     
-    if df[target_col].isna().any():
-        unknown = sorted(df.loc[df[target_col].isna(), source_col].unique())
+    if mapped.isna().any():
+        unknown = sorted(labels[mapped.isna()].astype(str))
         raise ValueError(f"Unknown region labels encountered: {unknown}")
     
+    regions = sorted(set(mapped))
+    label_codes = np.array([regions.index(name) for name in mapped], dtype="int8")
+    
+    df = df.copy()
+    df[target_col] = pd.Categorical.from_codes(label_codes[codes], categories=regions)
+    
     return df
 
 
+#aggregation
+def weighted_group_mean(codes: np.ndarray, values: np.ndarray, weights: np.ndarray,
+                        n_groups: int) -> tuple[np.ndarray, np.ndarray]:
+    """Weighted mean per group, computed in a single pass.
+    
+    Accumulates sum(value * weight) and sum(weight) per group with
+    np.bincount (compiled loop, no per-group Python call).
+    
+    Args:
+        codes: Group code per row, in range(n_groups) (e.g. from pd.factorize)
+        values: Value per row
+        weights: Weight per row; a NaN weight makes its group's mean NaN
+        n_groups: Number of groups
+        
+    Returns:
+        tuple: (weighted mean per group, total weight per group); groups with
+        zero total weight get NaN/inf means, so callers should check the totals
+    """
+    num = np.bincount(codes, weights=values * weights, minlength=n_groups)
+    den = np.bincount(codes, weights=weights, minlength=n_groups)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return num / den, den
+
+
+def pivot_units(df: pd.DataFrame, keys: list[str], aggfunc: str | None = "sum",
+                unit_col: str = "UNIT", value_col: str = "VALUE") -> pd.DataFrame:
+    """Pivot CPNI %/Number rows into Percentage and Absolute columns.
+    
+    Shared reshape for the cleaners whose tables report each category both as
+    a share and as a count. Label keys are grouped as categoricals and the
+    unit level is unstacked, which is the pivot_table result without its
+    overhead. Rows come out sorted by keys.
+    
+    Args:
+        df: Long-format data with one row per key combination and unit
+        keys: Columns identifying an output row (e.g. ["Year", "Region", "Type"])
+        aggfunc: Aggregation for duplicate key/unit rows ("sum", "first", ...),
+            or None when each key/unit pair occurs once: a plain set_index +
+            unstack reshape with no aggregation pass
+        unit_col: Column holding the unit labels ("%" / "Number")
+        value_col: Column holding the values
+        
+    Returns:
+        pd.DataFrame: keys plus Percentage and Absolute; Absolute is rounded to int32
+        
+    Raises:
+        ValueError: If an unknown unit appears, a unit is missing entirely,
+            any value is missing after the pivot, or (aggfunc=None) a key/unit
+            pair is duplicated
+    """
+    units = df[unit_col].map(UNIT_COLUMN_MAP)
+    if units.isna().any():
+        bad = sorted(df.loc[units.isna(), unit_col].unique())
+        raise ValueError(f"Unexpected UNIT values encountered: {bad}")
+
+    label_keys = {k: "category" for k in keys if not pd.api.types.is_numeric_dtype(df[k])}
+    tidy = df[keys].astype(label_keys).assign(UNIT_M=units.astype("category"), VALUE=df[value_col])
+    if aggfunc is None:
+        #unique keys: reshape only, and say so loudly if that assumption breaks
+        if tidy.duplicated(subset=[*keys, "UNIT_M"]).any():
+            raise ValueError(f"Duplicate {keys} rows for a unit; pass an aggfunc to combine them")
+        values = tidy.set_index([*keys, "UNIT_M"])["VALUE"]
+    else:
+        values = tidy.groupby([*keys, "UNIT_M"], observed=True, sort=True)["VALUE"].agg(aggfunc)
+    out = values.unstack("UNIT_M").reset_index().rename_axis(None, axis=1)
+
+    if "Percentage" not in out.columns or "Absolute" not in out.columns:
+        raise ValueError(f"Expected both Percentage and Absolute after pivot; got: {list(out.columns)}")
+
+    out["Percentage"] = pd.to_numeric(out["Percentage"], errors="coerce")
+    out["Absolute"] = pd.to_numeric(out["Absolute"], errors="coerce")
+
+    if out[["Percentage", "Absolute"]].isna().any().any():
+        raise ValueError("Found NaNs in Percentage/Absolute after pivot + coercion")
+
+    out["Absolute"] = np.rint(out["Absolute"].to_numpy(dtype="float64")).astype("int32")
+    return out
+
+
 #data cleaning
 def clean_string_column(series: pd.Series) -> pd.Series:
     """Standardize string column by converting to string and stripping whitespace.
@@ -173,19 +430,211 @@ def clean_string_column(series: pd.Series) -> pd.Series:
     Returns:
         pd.Series: Cleaned series
     """
+    #label columns repeat a handful of values: clean each distinct one once, then broadcast by code
+    if pd.api.types.is_string_dtype(series):
+        codes, uniques = pd.factorize(series, use_na_sentinel=False)
+        if len(uniques) * _REPEAT_FACTOR < len(series):
+            cleaned = pd.Series(uniques).astype(str).str.strip()
+            return pd.Series(cleaned.array.take(codes), index=series.index, name=series.name)
     return series.astype(str).str.strip()
 
 
-def clean_numeric_column(series: pd.Series, drop_na: bool = False) -> pd.Series:
+def clean_string_columns(df: pd.DataFrame, cols: Iterable[str]) -> pd.DataFrame:
+    """Standardize several string columns in one pass.
+    
+    Converts to Arrow-backed strings so the strip runs as Arrow's vectorised
+    utf8_trim_whitespace kernel rather than per-object Python calls.
+    
+    Args:
+        df: DataFrame to clean (modified in place)
+        cols: Column names to convert and strip
+        
+    Returns:
+        pd.DataFrame: The same DataFrame, for chaining
+    """
+    cols_list = list(cols)
+    df[cols_list] = df[cols_list].astype("string[pyarrow]").apply(lambda s: s.str.strip())
+    return df
+
+
+def clean_numeric_column(series: pd.Series, drop_na: bool = False,
+                         dtype: str | None = None) -> pd.Series:
     """Convert column to numeric type, coercing errors.
     
     Args:
         series: Pandas series to convert
         drop_na: If True, return series with NaN values dropped
+        dtype: Optional dtype to cast to, e.g. "float32" for count columns
+            (exact up to ~16.7 million) to halve the bytes later steps move.
+            Leave unset for percentages/derived values written to CSV, where
+            float32 rounding would show up in the output
         
     Returns:
         pd.Series: Series with numeric values
     """
-    result = pd.to_numeric(series, errors="coerce")
+    result = None
+    if not pd.api.types.is_numeric_dtype(series):
+        #raw values repeat ("-", "..", round counts): parse each distinct string once
+        codes, uniques = pd.factorize(series, use_na_sentinel=False)
+        if len(uniques) * _REPEAT_FACTOR < len(series):
+            parsed = pd.to_numeric(pd.Series(uniques), errors="coerce")
+            result = pd.Series(parsed.array.take(codes), index=series.index, name=series.name)
+    if result is None:
+        result = pd.to_numeric(series, errors="coerce")
+    if dtype is not None:
+        result = result.astype(dtype)
     return result.dropna() if drop_na else result
 
+
+#loading
+def read_raw_csv(raw_path: Path, usecols: list[str]) -> pd.DataFrame:
+    """Read the given columns of a raw CSV with the pyarrow engine.
+    
+    The multithreaded Arrow reader parses only `usecols`, straight into
+    Arrow-backed dtypes. The header is checked first, since pyarrow fails on
+    a missing usecols entry with an ArrowKeyError rather than a ValueError.
+    
+    Args:
+        raw_path: Raw CSV path
+        usecols: Columns to read; all must be present
+        
+    Returns:
+        pd.DataFrame: The requested columns
+        
+    Raises:
+        ValueError: If any of `usecols` is missing from the header
+    """
+    ensure_cols(pd.read_csv(raw_path, nrows=0), usecols)
+    return pd.read_csv(raw_path, engine="pyarrow", usecols=usecols, dtype_backend="pyarrow")
+
+
+def read_cso_csv(raw_path: Path, aliases: dict[str, tuple[str, ...]],
+                 required: Iterable[str] = (), what: str = "CSO export"
+                 ) -> tuple[pd.DataFrame, dict[str, str | None]]:
+    """Read just the wanted columns of a CSO/NISRA export, however their headers are spelled.
+    
+    Peeks the header row, resolves each logical column to the first header
+    matching one of its aliases (compared stripped and lower-cased), then
+    reads only those columns with the pyarrow engine into Arrow-backed dtypes.
+    
+    Args:
+        raw_path: Raw CSV path
+        aliases: Logical column name -> accepted header spellings, in priority order
+        required: Logical names that must resolve to a header
+        what: Table description used in the error message
+        
+    Returns:
+        tuple: (projected DataFrame, logical name -> resolved header or None)
+        
+    Raises:
+        ValueError: If a required column has no matching header
+    """
+    header = pd.read_csv(raw_path, nrows=0).columns
+    
+    #first header wins if two normalise to the same name
+    norm_cols: dict[str, str] = {}
+    for c in header:
+        norm_cols.setdefault(c.strip().lower(), c)
+    resolved = {
+        key: next((norm_cols[n.lower()] for n in names if n.lower() in norm_cols), None)
+        for key, names in aliases.items()
+    }
+    
+    missing = [key for key in required if resolved[key] is None]
+    if missing:
+        raise ValueError(
+            f"Could not identify required columns in {what}: {missing}\n"
+            f"Columns found: {list(header)}"
+        )
+    
+    usecols = list(dict.fromkeys(c for c in resolved.values() if c is not None))
+    df = pd.read_csv(raw_path, engine="pyarrow", usecols=usecols, dtype_backend="pyarrow")
+    return df, resolved
+
+
+def load_population_weights(path: Path) -> pd.DataFrame:
+    """Load cleaned ROI/NI populations used to weight All-Island figures.
+    
+    Prefers the typed Parquet sibling of `path` when it is current (see
+    `write_cleaned_table`), parses Year/Population once, drops unparsed or
+    non-ROI/NI rows and sums any repeated Year/Region pairs.
+    
+    Args:
+        path: Cleaned population_over_time.csv
+        
+    Returns:
+        pd.DataFrame: Year (int64), Region, Population (int64)
+        
+    Raises:
+        FileNotFoundError: If the cleaned CSV does not exist
+        ValueError: If Year, Region or Population is missing
+    """
+    if not path.exists():
+        raise FileNotFoundError(f"Missing {path.name}; required for All-Island weighting.")
+    
+    parquet_path = path.with_suffix(".parquet")
+    pop = pd.read_parquet(parquet_path) if output_is_current(parquet_path, path) else pd.read_csv(path)
+    if not {"Year", "Region", "Population"}.issubset(pop.columns):
+        raise ValueError(f"{path.name} must contain columns: Year, Region, Population")
+    
+    #parse once, then one mask and a direct int64 cast (no nullable Int64 detour)
+    year = pd.to_numeric(pop["Year"], errors="coerce")
+    population = pd.to_numeric(pop["Population"], errors="coerce")
+    region = pop["Region"].astype(str).str.strip()
+    keep = year.notna() & population.notna() & region.isin([ROI_LABEL, NI_LABEL])
+    pop = pd.DataFrame({
+        "Year": year[keep].astype("int64"),
+        "Region": region[keep],
+        "Population": population[keep].astype("int64"),
+    })
+    
+    #one pass: a no-op collapse on unique keys, a sum where a year/region repeats
+    return pop.groupby(["Year", "Region"], as_index=False, sort=False)["Population"].sum()
+
+
+def load_cpni(raw_path: Path, required_cols: list[str], string_cols: list[str],
+              statistic_contains: str | None = None, value_dtype: str | None = None,
+              region_col: str = "Ireland and Northern Ireland",
+              year_col: str = "Census Year") -> pd.DataFrame:
+    """Load a CSO/NISRA joint publication (CPNI) table with the shared prologue.
+    
+    Reads only `required_cols` with the pyarrow engine into Arrow-backed
+    dtypes, optionally keeps the rows whose "Statistic Label" contains
+    `statistic_contains` (before any stripping, so discarded rows are never
+    processed), strips `string_cols`, coerces VALUE (dropping non-numeric
+    rows), maps `region_col` to "Region" and parses `year_col` into "Year".
+    
+    Args:
+        raw_path: Raw CSV path
+        required_cols: Columns to read; all must be present
+        string_cols: Columns to strip
+        statistic_contains: Case-insensitive "Statistic Label" filter (None to skip)
+        value_dtype: Optional dtype for VALUE (see `clean_numeric_column`)
+        region_col: Raw region column
+        year_col: Raw census year column
+        
+    Returns:
+        pd.DataFrame: Filtered frame with cleaned strings, numeric VALUE,
+        "Region" and "Year" columns
+        
+    Raises:
+        ValueError: If columns are missing or the statistic filter leaves no rows
+    """
+    df = read_raw_csv(raw_path, required_cols)
+    
+    if statistic_contains is not None:
+        df = df[df["Statistic Label"].str.contains(statistic_contains, case=False, na=False)]
+        if df.empty:
+            raise ValueError(
+                "After filtering by statistic label, no rows remain. "
+                "Check FILTER_STATISTIC_CONTAINS against the raw file."
+            )
+    
+    clean_string_columns(df, string_cols)
+    
+    df["VALUE"] = clean_numeric_column(df["VALUE"], dtype=value_dtype)
+    df = df.dropna(subset=["VALUE"])
+    
+    df = map_regions(df, region_col, "Region")
+    df["Year"] = parse_census_years(df[year_col])
+    return df
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from pathlib import Path
 from typing import List
 
 import pandas as pd
@@ -22,6 +23,26 @@ def ensure_cols(df: pd.DataFrame, cols: List[str]) -> None:
         raise ValueError(f"Expected columns {cols}, got {list(df.columns)}")
 
 
+#loading
+def read_cleaned_table(path: Path) -> pd.DataFrame:
+    """Read a cleaned table, preferring its Parquet sibling when it is up to date.
+    
+    Args:
+        path: Path to the cleaned CSV
+        
+    Returns:
+        DataFrame loaded from <name>.parquet if it exists and is not older than
+        the CSV, otherwise from the CSV itself
+    """
+    path = Path(path)
+    parquet_path = path.with_suffix(".parquet")
+    if parquet_path.exists() and (
+        not path.exists() or parquet_path.stat().st_mtime >= path.stat().st_mtime
+    ):
+        return pd.read_parquet(parquet_path)
+    return pd.read_csv(path)
+
+
 #data cleaning
 def clean_region_column(series: pd.Series) -> pd.Series:
     """Standardize region names by stripping whitespace.
@@ -65,3 +86,42 @@ NI = "Northern Ireland"
 ALL = "All-Island"
 REGIONS: List[str] = [ROI, NI]
 ALL_REGIONS: List[str] = [ROI, NI, ALL]
+
+#overview figures (2023 GDP; native GDP is None where currencies are mixed)
+USD_RATES_2023 = {
+    "GBPUSD": 1.2440,
+    "EURUSD": 1.0817,
+}
+
+NATIONS = {
+    "ROI": {
+        "name": "Republic of Ireland (ROI)",
+        "overview": "An independent, sovereign nation",
+        "capital": "Dublin",
+        "gdp_usd_b": 551.604,
+        "gdp_native_b": 509.952,
+        "native_currency": "EUR (€)",
+        "counties": 26,
+        "map_colour": "Green",
+    },
+    "NI": {
+        "name": "Northern Ireland (NI)",
+        "overview": "A constituent nation of the United Kingdom (UK)",
+        "capital": "Belfast",
+        "gdp_usd_b": 78.701,
+        "gdp_native_b": 63.265,
+        "native_currency": "GBP (£)",
+        "counties": 6,
+        "map_colour": "Blue",
+    },
+    "ALL": {
+        "name": "All-Island",
+        "overview": "A geographical island comprising ROI and NI",
+        "capital": "Dublin / Belfast",
+        "gdp_usd_b": 630.305,
+        "gdp_native_b": None,  #mixed currencies
+        "native_currency": "EUR + GBP (€ + £)",
+        "counties": 32,
+        "map_colour": "Green + Blue",
+    },
+}
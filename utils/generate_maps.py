@@ -1,7 +1,15 @@
+from __future__ import annotations
+
+import base64
 import folium
+import gzip
 import json
+import orjson
+import os
 import streamlit as st
-from streamlit.components.v1 import html
+import string
+from folium.elements import JSCSSMixin
+from folium.template import Template
 
 
 CAPITALS = {
@@ -15,84 +23,183 @@ CAPITALS = {
     },
 }
 
+#per-jurisdiction paint, picked per feature from its "jurisdiction" property
+JURISDICTION_STYLES = {
+    "Republic of Ireland": {
+        "style": {"fillColor": "#33aa33", "color": "#228822", "weight": 1, "fillOpacity": 0.25},
+        "highlight": {"weight": 3, "color": "#000000", "fillOpacity": 0.35},
+    },
+    "Northern Ireland": {
+        "style": {"fillColor": "#3355ff", "color": "#2233aa", "weight": 2, "fillOpacity": 0.30},
+        "highlight": {"weight": 3, "color": "#000000", "fillOpacity": 0.45},
+    },
+}
+
+#leaflet polyline simplification at draw time (default 1.0); higher = fewer vertices drawn
+SMOOTH_FACTOR = 2.0
+
+PAKO_JS = "https://cdn.jsdelivr.net/npm/pako@2.1.0/dist/pako.min.js"
+_DATA_PLACEHOLDER = "__GZIP_GEOJSON_DATA__"
+#browser-side expression that rebuilds the layer data from the embedded gzip blob
+_INFLATE_JS = string.Template(
+    'JSON.parse(pako.inflate(Uint8Array.from(atob("$payload"), '
+    'c => c.charCodeAt(0)), {to: "string"}))'
+)
+
+
+class GzipGeoJson(JSCSSMixin, folium.GeoJson):
+    """
+    folium.GeoJson that embeds its data gzip-compressed + base64-encoded and
+    inflates it in the browser with pako, instead of inlining the raw JSON text
+    (which is also HTML-escaped into the iframe srcdoc). Polygon coordinates
+    compress very well, so the payload sent to the browser shrinks several-fold.
+
+    If `url` is given nothing is embedded: the browser fetches the file itself
+    (e.g. from Streamlit's static folder) and can cache it across reruns. The
+    file at `url` must hold the same features as `data`, which is still used
+    server-side for styling and tooltip fields.
+    """
+
+    default_js = [("pako", PAKO_JS)]
+
+    def __init__(self, data: dict, *args, url: str | None = None, **kwargs):
+        super().__init__(data, *args, **kwargs)
+        if url is not None:
+            self.embed = False
+            self.embed_link = url
+            self.default_js = []
+
+    _template = Template(
+        """
+        {% macro script(this, kwargs) %}
+        {{ this.render_compressed_script(kwargs) }}
+        {% endmacro %}
+        """
+    )
+
+    def render_compressed_script(self, kwargs) -> str:
+        if not self.embed:
+            return folium.GeoJson._template.module.script(self, kwargs)
+
+        #render the stock GeoJson script with a placeholder in place of the inline data
+        data = self.data
+        self.data = _DATA_PLACEHOLDER
+        try:
+            script = folium.GeoJson._template.module.script(self, kwargs)
+        finally:
+            self.data = data
+
+        payload = base64.b64encode(gzip.compress(orjson.dumps(data))).decode("ascii")
+        return script.replace(json.dumps(_DATA_PLACEHOLDER), _INFLATE_JS.substitute(payload=payload))
+
+
+@st.cache_resource(show_spinner=False)
+def _load_geojson_cached(path: str, mtime: float) -> dict:
+    #mtime is only part of the cache key, so an edited file is re-parsed
+    with open(path, "rb") as file:
+        return orjson.loads(file.read())
+
+
+def load_geojson(path: str) -> dict:
+    """
+    Loads a GeoJSON file, keeping one parsed copy per (path, mtime) shared
+    across sessions so reruns and new sessions skip the JSON parse.
+
+    Returns:
+        dict: Parsed GeoJSON payload.
+    """
+    return _load_geojson_cached(path, os.path.getmtime(path))
+
+
+def merge_island_geojson(ireland_geo: dict, ni_geo: dict) -> dict:
+    """
+    Merges separate ROI + NI GeoJSON payloads into the single tagged
+    FeatureCollection that `cleaning_scripts/clean_map_geodata.py` produces.
+
+    The input dicts are left untouched, so cached payloads can be passed in.
+
+    Returns:
+        dict: FeatureCollection whose features carry "jurisdiction" and "display_name".
+    """
+    features = []
+    for geo, jurisdiction, name_key in (
+        (ireland_geo, "Republic of Ireland", "name"),
+        (ni_geo, "Northern Ireland", "CountyName"),
+    ):
+        for feat in geo.get("features", []):
+            properties = feat.get("properties") or {}
+            features.append({
+                "type": "Feature",
+                "id": str(len(features)),
+                "properties": {
+                    "jurisdiction": jurisdiction,
+                    "display_name": str(properties.get(name_key) or "").title(),
+                },
+                "geometry": feat["geometry"],
+            })
+    return {"type": "FeatureCollection", "features": features}
+
 
 def render_ireland_map(ireland_path: str, ni_path: str, county_view: bool) -> str:
     """
-    Renders an OpenStreetMap map with:
-    - Republic of Ireland highlighted green (as ONE layer)
-    - Northern Ireland highlighted blue
+    Compatibility wrapper with the original file-path signature: loads the
+    ROI and NI GeoJSON files, merges them with `merge_island_geojson` and
+    renders the result with `render_ireland_map_from_dicts`.
+
+    Returns:
+        str: HTML representation of the map to be embedded with `html(...)`.
+    """
+    island_geo = merge_island_geojson(load_geojson(ireland_path), load_geojson(ni_path))
+    return render_ireland_map_from_dicts(island_geo, county_view)
+
+
+def render_ireland_map_from_dicts(
+    island_geo: dict,
+    county_view: bool,
+    url: str | None = None,
+) -> str:
+    """
+    Renders an OpenStreetMap map with one island layer:
+    - Republic of Ireland features highlighted green
+    - Northern Ireland features highlighted blue
     - Tooltips which show county names when county_view=True,
-      or static nation labels when county_view=False.
+      or the jurisdiction name when county_view=False.
+
+    island_geo must be tagged like `merge_island_geojson` output. When url is
+    given, the browser loads the layer from the URL instead of it being
+    embedded in the HTML.
 
     Returns:
         str: HTML representation of the map to be embedded with `html(...)`.
     """
 
-    #creates base map
+    #creates base map (canvas renderer: one <canvas> instead of an SVG node per polygon)
     open_street_map = folium.Map(
         location=[53.5, -7.5],
         zoom_start=6,
-        tiles="OpenStreetMap"
+        tiles="OpenStreetMap",
+        prefer_canvas=True,
     )
 
-    #loads ROI + NI GeoJSON
-    with open(ireland_path, "r") as file:
-        ireland_geo = json.load(file)
-
-    with open(ni_path, "r") as file:
-        ni_geo = json.load(file)
-
-    #creates common "display_name"
-    [feat.setdefault("properties", {}).update(
-        {"display_name": feat["properties"].get("name", "").title()}
-    ) for feat in ireland_geo.get("features", [])]
-
-    [feat.setdefault("properties", {}).update(
-        {"display_name": feat["properties"].get("CountyName", "").title()}
-    ) for feat in ni_geo.get("features", [])]
-
-    #tooltip config: county -> show feature 'name'; nation -> static label
-    if county_view:
-        common_tooltip = dict(
-            fields=["display_name"],
-            aliases=["County:"],
-            localize=True,
-            sticky=True,
-            labels=True,
-            style=("background-color: white; color: #222; border: 1px solid #ccc;")
-        )
-        roi_tooltip = folium.features.GeoJsonTooltip(**common_tooltip)
-        ni_tooltip  = folium.features.GeoJsonTooltip(**common_tooltip)
-    else:
-        roi_tooltip = folium.Tooltip("Republic of Ireland")
-        ni_tooltip  = folium.Tooltip("Northern Ireland")
-
-    #ROI
-    folium.GeoJson(
-        ireland_geo,
-        name="Republic of Ireland",
-        style_function=lambda feat: {
-            "fillColor": "#33aa33",
-            "color": "#228822",
-            "weight": 1,
-            "fillOpacity": 0.25,
-        },
-        highlight_function=lambda feat: {"weight": 3, "color": "#000000", "fillOpacity": 0.35},
-        tooltip=roi_tooltip
-    ).add_to(open_street_map)
+    #tooltip config: county -> show feature 'display_name'; nation -> jurisdiction
+    tooltip = folium.features.GeoJsonTooltip(
+        fields=["display_name"] if county_view else ["jurisdiction"],
+        aliases=["County:"] if county_view else None,
+        localize=True,
+        sticky=True,
+        labels=county_view,
+        style=("background-color: white; color: #222; border: 1px solid #ccc;")
+    )
 
-    #NI
-    folium.GeoJson(
-        ni_geo,
-        name="Northern Ireland",
-        style_function=lambda feat: {
-            "fillColor": "#3355ff",
-            "color": "#2233aa",
-            "weight": 2,
-            "fillOpacity": 0.30,
-        },
-        highlight_function=lambda feat: {"weight": 3, "color": "#000000", "fillOpacity": 0.45},
-        tooltip=ni_tooltip
+    #ROI + NI as one layer, styled per feature
+    GzipGeoJson(
+        island_geo,
+        name="Island of Ireland",
+        style_function=lambda feat: JURISDICTION_STYLES[feat["properties"]["jurisdiction"]]["style"],
+        highlight_function=lambda feat: JURISDICTION_STYLES[feat["properties"]["jurisdiction"]]["highlight"],
+        smooth_factor=SMOOTH_FACTOR,
+        tooltip=tooltip,
+        url=url,
     ).add_to(open_street_map)
 
     #capital city markers (nation view only)